@@ -23,15 +23,24 @@ class Settings(BaseSettings):
     # Telegram notifications
     telegram_bot_token: str = ""
     telegram_chat_id: str = ""
+    # Webhook mode for bot commands (empty URL = long polling)
+    telegram_webhook_url: str = ""  # public URL routed to POST /api/telegram/webhook
+    telegram_webhook_secret: str = ""
 
     # App
     db_path: str = "sports_arb.db"
     host: str = "0.0.0.0"
     port: int = 8000
     poll_interval: int = 10
+    price_ttl: float = 2.0  # skip re-fetching prices younger than this (seconds, 0 = off)
     min_arb_percent: float = 0.5
     max_arb_percent: float = 50.0
     min_volume: int = 0
+    # API request budgets (requests started per second)
+    poly_max_requests_per_sec: int = 50
+    poly_book_requests_per_10s: int = 1500  # CLOB /book budget, on Polymarket's 10s window
+    kalshi_max_requests_per_sec: int = 20  # Kalshi basic tier read limit
+    poly_ws_shards: int = 4  # Polymarket price WS connections the tokens are split across
 
     # Live mode settings
     allow_live_arbs: bool = True
@@ -1,10 +1,39 @@
 from __future__ import annotations
 
 import abc
+import importlib.util
+import json
 from typing import AsyncIterator
 
+import httpx
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
 from src.models import Market, MarketPrice
 
+# HTTP/2 multiplexes concurrent requests over one connection; httpx needs
+# the optional h2 package for it and falls back to HTTP/1.1 without it
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# Decoder for API response bodies and WS frames: orjson when installed.
+# Both accept bytes and raise ValueError subclasses on bad input.
+json_loads = orjson.loads if orjson is not None else json.loads
+
+# Connection pools are the only concurrency cap on API calls: requests
+# beyond the pool queue inside httpx until a connection frees up, rather
+# than behind a separate asyncio.Semaphore in front of the client
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+# Kalshi market data keeps its former 10-way cap (over HTTP/2 this bounds
+# connections, while the server's stream limit bounds requests multiplexed
+# on them). Trading never shares this pool: see KALSHI_TRADE_HTTP_LIMITS
+KALSHI_HTTP_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+# Kalshi order/balance calls get their own small pool so a live arb leg
+# never queues behind in-flight market data requests
+KALSHI_TRADE_HTTP_LIMITS = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+
 
 class BaseConnector(abc.ABC):
     """Abstract base class for market connectors."""
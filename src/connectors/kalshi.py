@@ -6,17 +6,30 @@ import logging
 import re
 from datetime import UTC, date, datetime
 from pathlib import Path
+from typing import Callable
 
 import httpx
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 
 from src.config import settings
-from src.connectors.base import BaseConnector
+from src.connectors.base import (
+    HTTP2_ENABLED,
+    KALSHI_HTTP_LIMITS,
+    KALSHI_TRADE_HTTP_LIMITS,
+    BaseConnector,
+    json_loads,
+)
+from src.connectors.rate_limit import RateLimiter
 from src.models import Market, MarketPrice, Platform
 
 logger = logging.getLogger(__name__)
 
+# Max tickers per GET /markets?tickers= batch price request
+_BATCH_TICKERS = 100
+# Upper bound on a 429 Retry-After we are willing to sleep for (seconds)
+_MAX_RETRY_AFTER = 30.0
+
 # Map Kalshi series/event ticker prefixes to sport codes
 _KALSHI_SPORT_MAP: dict[str, str] = {
     "KXEPL": "soccer", "KXLALIGA": "soccer", "KXBUNDESLIGA": "soccer",
@@ -191,13 +204,29 @@ GAME_TICKER_PREFIXES = (
 class KalshiConnector(BaseConnector):
     def __init__(self) -> None:
         self._http: httpx.AsyncClient | None = None
+        self._trade_http: httpx.AsyncClient | None = None  # orders + balance only
         self._private_key = None
         self._api_key_id: str = ""
+        # Shared by every _request_with_retry call (and get_balance) so bursts stay
+        # under the read quota; in-flight market data requests are capped by
+        # the _http pool (KALSHI_HTTP_LIMITS), trading uses its own _trade_http
+        self.rate_limiter = RateLimiter(
+            max_concurrent=None, max_requests=settings.kalshi_max_requests_per_sec,
+        )
 
     async def connect(self) -> None:
         self._http = httpx.AsyncClient(
             base_url=settings.kalshi_api_base,
             timeout=30,
+            http2=HTTP2_ENABLED,
+            limits=KALSHI_HTTP_LIMITS,
+        )
+        # Separate persistent client for trading: keeps TLS reuse without
+        # sharing the market data pool, which caps scan concurrency
+        self._trade_http = httpx.AsyncClient(
+            timeout=30,
+            http2=HTTP2_ENABLED,
+            limits=KALSHI_TRADE_HTTP_LIMITS,
         )
         if settings.kalshi_api_key_id and settings.kalshi_private_key_path:
             self._load_rsa_key()
@@ -243,6 +272,8 @@ class KalshiConnector(BaseConnector):
     async def disconnect(self) -> None:
         if self._http:
             await self._http.aclose()
+        if self._trade_http:
+            await self._trade_http.aclose()
 
     # Known championship/futures event tickers to fetch directly
     FUTURES_EVENT_TICKERS = (
@@ -321,9 +352,14 @@ class KalshiConnector(BaseConnector):
             full_path = req.url.raw_path.decode()
             auth_headers = self._sign_request(method, full_path)
 
-            resp = await self._http.request(method, path, params=params, headers=auth_headers)
+            async with self.rate_limiter:
+                resp = await self._http.request(method, path, params=params, headers=auth_headers)
             if resp.status_code == 429:
-                wait = 2 * (attempt + 1)
+                # Honor the server's Retry-After (seconds) when given
+                try:
+                    wait = min(float(resp.headers["Retry-After"]), _MAX_RETRY_AFTER)
+                except (KeyError, ValueError):
+                    wait = 2 * (attempt + 1)
                 logger.warning(f"Kalshi 429 on {path}, retry {attempt+1}/{max_retries} after {wait}s")
                 await asyncio.sleep(wait)
                 continue
@@ -340,7 +376,7 @@ class KalshiConnector(BaseConnector):
                 "GET", "/markets",
                 params={"event_ticker": event_ticker, "status": "open", "limit": 200},
             )
-            return resp.json().get("markets", [])
+            return json_loads(resp.content).get("markets", [])
         except Exception:
             logger.warning(f"Failed to fetch markets for {event_ticker}")
             return []
@@ -368,7 +404,7 @@ class KalshiConnector(BaseConnector):
                     params["cursor"] = cursor
 
                 resp = await self._request_with_retry("GET", "/markets", params=params)
-                data = resp.json()
+                data = json_loads(resp.content)
 
                 for m in data.get("markets", []):
                     event_ticker = m.get("event_ticker", "")
@@ -524,7 +560,7 @@ class KalshiConnector(BaseConnector):
                             if evt_cursor:
                                 params["cursor"] = evt_cursor
                             resp = await self._request_with_retry("GET", "/events", params=params)
-                            events_data = resp.json()
+                            events_data = json_loads(resp.content)
                             for evt in events_data.get("events", []):
                                 for m in evt.get("markets", []):
                                     ticker = m.get("ticker", "")
@@ -570,7 +606,7 @@ class KalshiConnector(BaseConnector):
                             if evt_cursor:
                                 params["cursor"] = evt_cursor
                             resp = await self._request_with_retry("GET", "/events", params=params)
-                            events_data = resp.json()
+                            events_data = json_loads(resp.content)
                             for evt in events_data.get("events", []):
                                 evt_parsed: list[Market] = []
                                 for m in evt.get("markets", []):
@@ -809,60 +845,111 @@ class KalshiConnector(BaseConnector):
 
         return market
 
+    @staticmethod
+    def _parse_market_price(data: dict) -> MarketPrice:
+        """Build a MarketPrice from a Kalshi market object (prices in cents)."""
+        yes_bid = (data.get("yes_bid") or 0) / 100
+        yes_ask = (data.get("yes_ask") or 0) / 100
+        no_bid = (data.get("no_bid") or 0) / 100
+        no_ask = (data.get("no_ask") or 0) / 100
+
+        last_price = data.get("last_price", 0)
+        if last_price:
+            yes_price = last_price / 100
+        elif yes_bid and yes_ask:
+            yes_price = (yes_bid + yes_ask) / 2
+        else:
+            yes_price = yes_bid or yes_ask
+
+        return MarketPrice(
+            yes_price=round(yes_price, 4),
+            no_price=round(1 - yes_price, 4),
+            yes_bid=yes_bid or None,
+            yes_ask=yes_ask or None,
+            no_bid=no_bid or None,
+            no_ask=no_ask or None,
+            volume=data.get("volume", 0),
+            last_updated=datetime.now(UTC),
+        )
+
     async def fetch_price(self, market_id: str) -> MarketPrice | None:
         """Fetch price for a single Kalshi market."""
         try:
             resp = await self._request_with_retry("GET", f"/markets/{market_id}")
-            data = resp.json().get("market", resp.json())
-
-            yes_bid = (data.get("yes_bid") or 0) / 100
-            yes_ask = (data.get("yes_ask") or 0) / 100
-            no_bid = (data.get("no_bid") or 0) / 100
-            no_ask = (data.get("no_ask") or 0) / 100
-
-            last_price = data.get("last_price", 0)
-            if last_price:
-                yes_price = last_price / 100
-            elif yes_bid and yes_ask:
-                yes_price = (yes_bid + yes_ask) / 2
-            else:
-                yes_price = yes_bid or yes_ask
-
-            return MarketPrice(
-                yes_price=round(yes_price, 4),
-                no_price=round(1 - yes_price, 4),
-                yes_bid=yes_bid or None,
-                yes_ask=yes_ask or None,
-                no_bid=no_bid or None,
-                no_ask=no_ask or None,
-                volume=data.get("volume", 0),
-                last_updated=datetime.now(UTC),
-            )
+            body = json_loads(resp.content)
+            data = body.get("market", body)
+            return self._parse_market_price(data)
         except Exception:
             logger.exception(f"Error fetching Kalshi price for {market_id}")
             return None
 
-    async def poll_active_markets(self, market_ids: list[str]) -> dict[str, MarketPrice]:
-        """Batch fetch fresh prices for specific market IDs (used between full scans)."""
+    async def fetch_prices_batch(
+        self,
+        market_ids: list[str],
+        on_price: Callable[[str, MarketPrice], None] | None = None,
+    ) -> dict[str, MarketPrice]:
+        """Fetch prices for many markets via GET /markets?tickers=..., chunked.
+
+        Tickers missing from the response (or from a failed chunk) are simply
+        absent from the result; callers fall back to fetch_price for those.
+        on_price, if given, is called for each price as soon as its chunk lands.
+        """
         results: dict[str, MarketPrice] = {}
-        if not market_ids:
-            return results
+        market_ids = list(dict.fromkeys(market_ids))  # request each ticker once
+        chunks = [
+            market_ids[i:i + _BATCH_TICKERS]
+            for i in range(0, len(market_ids), _BATCH_TICKERS)
+        ]
 
-        _sem = asyncio.Semaphore(5)
+        async def _fetch_chunk(chunk: list[str]) -> None:
+            try:
+                resp = await self._request_with_retry(
+                    "GET", "/markets",
+                    params={"tickers": ",".join(chunk), "limit": len(chunk)},
+                )
+                markets = json_loads(resp.content).get("markets", [])
+            except Exception as e:
+                logger.warning(f"Kalshi batch price fetch failed: {e}")
+                return
+            for m in markets:
+                ticker = m.get("ticker")
+                if ticker:
+                    price = results[ticker] = self._parse_market_price(m)
+                    if on_price:
+                        on_price(ticker, price)
+
+        await asyncio.gather(*(_fetch_chunk(c) for c in chunks))
+        return results
+
+    async def poll_active_markets(
+        self,
+        market_ids: list[str],
+        on_price: Callable[[str, MarketPrice], None] | None = None,
+    ) -> dict[str, MarketPrice]:
+        """Batch fetch fresh prices for specific market IDs (used between full scans).
+
+        One batched request per chunk of tickers, with per-market requests
+        only for tickers the batch did not return. on_price, if given, is
+        called for each price as it arrives, so a caller that gives up early
+        keeps everything that landed before then.
+        """
+        if not market_ids:
+            return {}
 
-        async def _fetch_one(mid: str) -> tuple[str, MarketPrice | None]:
-            async with _sem:
-                price = await self.fetch_price(mid)
-                return mid, price
+        results = await self.fetch_prices_batch(market_ids, on_price)
+        market_ids = [mid for mid in dict.fromkeys(market_ids) if mid not in results]
+        if not market_ids:
+            return results
 
-        tasks = [_fetch_one(mid) for mid in market_ids]
-        fetched = await asyncio.gather(*tasks, return_exceptions=True)
-        for res in fetched:
-            if isinstance(res, Exception):
-                continue
-            mid, price = res
+        # fetch_price goes through self.rate_limiter and handles its own errors
+        async def _fetch_one(mid: str) -> None:
+            price = await self.fetch_price(mid)
             if price:
                 results[mid] = price
+                if on_price:
+                    on_price(mid, price)
+
+        await asyncio.gather(*(_fetch_one(mid) for mid in market_ids))
         return results
 
     @staticmethod
@@ -1030,17 +1117,18 @@ class KalshiConnector(BaseConnector):
 
     async def get_balance(self) -> float:
         """Get available USD balance on Kalshi."""
-        if not self._http:
+        if not self._trade_http:
             raise RuntimeError("Kalshi connector not connected")
 
         # Sign the full path directly (not relying on httpx base_url)
         path = "/trade-api/v2/portfolio/balance"
         auth_headers = self._sign_request("GET", path)
 
-        # Make direct request to full URL
+        # Trading client (own pool, kept alive across calls). Balance is a
+        # read, so it shares the read quota with the scan via rate_limiter
         url = f"https://api.elections.kalshi.com{path}"
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.get(url, headers=auth_headers)
+        async with self.rate_limiter:
+            resp = await self._trade_http.get(url, headers=auth_headers)
 
         resp.raise_for_status()
         data = resp.json()
@@ -1086,10 +1174,11 @@ class KalshiConnector(BaseConnector):
             auth_headers = self._sign_request("POST", path)
             auth_headers["Content-Type"] = "application/json"
 
-            # Make direct request to full URL
+            # Trading client: no pool queueing behind market data, no new TLS
+            # handshake per order. Orders count against Kalshi's write quota,
+            # which the scan's read traffic does not touch
             url = f"https://api.elections.kalshi.com{path}"
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.post(url, json=order_data, headers=auth_headers)
+            resp = await self._trade_http.post(url, json=order_data, headers=auth_headers)
 
             if resp.status_code == 201 or resp.status_code == 200:
                 data = resp.json()
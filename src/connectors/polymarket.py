@@ -4,6 +4,7 @@ import asyncio
 import json
 import logging
 import re
+import socket
 from datetime import UTC, date, datetime
 from typing import AsyncIterator
 
@@ -11,11 +12,29 @@ import httpx
 import websockets
 
 from src.config import settings
-from src.connectors.base import BaseConnector
+from src.connectors.base import HTTP2_ENABLED, HTTP_LIMITS, BaseConnector, json_loads
 from src.models import Market, MarketPrice, Platform
 
 logger = logging.getLogger(__name__)
 
+# Price WS tuning: room for large book snapshots and bursts of updates
+_WS_MAX_SIZE = 4 * 1024 * 1024   # largest accepted message (default 1 MiB)
+_WS_MAX_QUEUE = 256              # buffered incoming messages (default 16)
+_WS_RCVBUF = 1 << 20             # kernel receive buffer for the WS socket
+
+
+def _tune_ws_socket(ws) -> None:
+    """Disable Nagle and enlarge the receive buffer on a connected WS."""
+    sock = ws.transport.get_extra_info("socket")
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _WS_RCVBUF)
+    except OSError as e:
+        logger.debug(f"Polymarket WS socket tuning skipped: {e}")
+
+
 # Map keywords in Polymarket event titles / tags to sport codes
 _POLY_SPORT_KEYWORDS: dict[str, str] = {
     "nba": "nba", "ncaa men's basketball": "ncaa_mb", "ncaa women's basketball": "ncaa_wb",
@@ -231,7 +250,8 @@ class PolymarketConnector(BaseConnector):
 
     def __init__(self) -> None:
         self._http: httpx.AsyncClient | None = None
-        self._ws = None
+        self._ws: dict = {}  # shard -> open price WS connection
+        self._ws_asset_ids: dict[int, set[str]] = {}  # shard -> subscribed tokens
         self._running = False
         self._trading_client = None  # Lazy-init for trading
 
@@ -239,12 +259,16 @@ class PolymarketConnector(BaseConnector):
         self._http = httpx.AsyncClient(
             base_url=settings.polymarket_gamma_api,
             timeout=30,
+            http2=HTTP2_ENABLED,
+            limits=HTTP_LIMITS,
         )
         self._clob = httpx.AsyncClient(
             base_url=settings.polymarket_clob_api,
             timeout=30,
+            http2=HTTP2_ENABLED,
+            limits=HTTP_LIMITS,
         )
-        logger.info("Polymarket connector initialized")
+        logger.info(f"Polymarket connector initialized (http2={HTTP2_ENABLED})")
 
     async def disconnect(self) -> None:
         self._running = False
@@ -252,8 +276,8 @@ class PolymarketConnector(BaseConnector):
             await self._http.aclose()
         if self._clob:
             await self._clob.aclose()
-        if self._ws:
-            await self._ws.close()
+        for ws in self._ws.values():
+            await ws.close()
 
     # Additional tag slugs to fetch — game markets under these tags often fall
     # outside the main "sports" tag pagination window (1000 event limit).
@@ -348,7 +372,7 @@ class PolymarketConnector(BaseConnector):
                     },
                 )
                 resp.raise_for_status()
-                data = resp.json()
+                data = json_loads(resp.content)
 
                 events = data if isinstance(data, list) else data.get("data", data.get("events", []))
                 if not events:
@@ -681,7 +705,7 @@ class PolymarketConnector(BaseConnector):
                 try:
                     resp = await self._clob.get("/midpoint", params={"token_id": clob_token_id})
                     resp.raise_for_status()
-                    data = resp.json()
+                    data = json_loads(resp.content)
                     mid = float(data.get("mid", 0))
                     if mid > 0:
                         logger.debug(f"CLOB midpoint for negRisk {clob_token_id[:20]}: {mid}")
@@ -696,7 +720,7 @@ class PolymarketConnector(BaseConnector):
         try:
             resp = await self._clob.get("/midpoint", params={"token_id": market_id})
             resp.raise_for_status()
-            data = resp.json()
+            data = json_loads(resp.content)
             mid = float(data.get("mid", 0))
             # Validate midpoint is reasonable (not 0 or 1)
             if mid <= 0 or mid >= 1:
@@ -722,7 +746,7 @@ class PolymarketConnector(BaseConnector):
         try:
             resp = await self._http.get(f"/markets/{market_id}")
             resp.raise_for_status()
-            data = resp.json()
+            data = json_loads(resp.content)
             # Gamma API returns outcomePrices as JSON string or list
             prices = self._parse_json_field(data.get("outcomePrices", "[]"))
             vol = 0.0
@@ -763,7 +787,7 @@ class PolymarketConnector(BaseConnector):
                 body = [{"token_id": tid, "side": "BUY"} for tid in chunk]
                 resp = await self._clob.post("/prices", json=body)
                 resp.raise_for_status()
-                data = resp.json()
+                data = json_loads(resp.content)
                 # Response: {token_id: {"BUY": price_str, "SELL": price_str}, ...}
                 for tid in chunk:
                     if tid not in data:
@@ -793,7 +817,7 @@ class PolymarketConnector(BaseConnector):
         try:
             resp = await self._clob.get(f"/book", params={"token_id": token_id})
             resp.raise_for_status()
-            data = resp.json()
+            data = json_loads(resp.content)
             raw_bids = data.get("bids", [])
             raw_asks = data.get("asks", [])
 
@@ -858,7 +882,7 @@ class PolymarketConnector(BaseConnector):
                 logger.info(f"Book empty for {token_id[:20]}, falling back to midpoint API")
                 mid_resp = await self._clob.get("/midpoint", params={"token_id": token_id})
                 mid_resp.raise_for_status()
-                mid = float(mid_resp.json().get("mid", 0))
+                mid = float(json_loads(mid_resp.content).get("mid", 0))
                 yes_depth = None
                 no_depth = None
 
@@ -913,7 +937,7 @@ class PolymarketConnector(BaseConnector):
                     },
                 )
                 resp.raise_for_status()
-                data = resp.json()
+                data = json_loads(resp.content)
                 events = data if isinstance(data, list) else data.get("data", data.get("events", []))
                 if not events:
                     break
@@ -955,38 +979,52 @@ class PolymarketConnector(BaseConnector):
 
         return new_tags
 
-    async def subscribe_prices(self, market_ids: list[str]) -> AsyncIterator[tuple[str, MarketPrice]]:
-        """Subscribe to WebSocket price changes using Polymarket CLOB WS protocol."""
+    async def subscribe_prices(
+        self, market_ids: list[str], shard: int = 0,
+    ) -> AsyncIterator[tuple[str, MarketPrice]]:
+        """Subscribe to WebSocket price changes using Polymarket CLOB WS protocol.
+
+        Each shard is its own connection; callers split tokens across shards
+        and run one subscription per shard.
+        """
         if not market_ids:
             return
 
         self._running = True
+        self._ws_asset_ids[shard] = set(market_ids)
         ws_url = settings.polymarket_ws_url
         reconnect_delay = 2  # Start with 2 second delay
         max_delay = 60  # Cap at 60 seconds
 
         while self._running:
             try:
-                async with websockets.connect(ws_url) as ws:
+                async with websockets.connect(
+                    ws_url, max_size=_WS_MAX_SIZE, max_queue=_WS_MAX_QUEUE,
+                ) as ws:
                     reconnect_delay = 2  # Reset delay on successful connection
-                    self._ws = ws
-                    # Single subscription message with all asset IDs
+                    _tune_ws_socket(ws)
+                    self._ws[shard] = ws
+                    # Single subscription message with all asset IDs (the
+                    # current set, which update_subscriptions may have changed)
+                    asset_ids = list(self._ws_asset_ids[shard])
                     sub_msg = json.dumps({
                         "type": "MARKET",
-                        "assets_ids": market_ids,
+                        "assets_ids": asset_ids,
                         "custom_feature_enabled": True,
                     })
                     await ws.send(sub_msg)
 
-                    logger.info(f"Polymarket WS: subscribing to {len(market_ids)} tokens")
+                    logger.info("Polymarket WS[%d]: subscribing to %d tokens", shard, len(asset_ids))
 
                     async for raw_msg in ws:
                         if not self._running:
                             break
                         try:
-                            parsed = json.loads(raw_msg)
+                            parsed = json_loads(raw_msg)
                             # Handle both single message and array of messages
                             messages = parsed if isinstance(parsed, list) else [parsed]
+                            # One timestamp for every update in this frame
+                            received_at = datetime.now(UTC)
 
                             for msg in messages:
                                 if not isinstance(msg, dict):
@@ -1003,7 +1041,7 @@ class PolymarketConnector(BaseConnector):
                                             mp = MarketPrice(
                                                 yes_price=price,
                                                 no_price=round(1 - price, 4),
-                                                last_updated=datetime.now(UTC),
+                                                last_updated=received_at,
                                             )
                                             # Include bid/ask if available
                                             bb = change.get("best_bid")
@@ -1031,7 +1069,7 @@ class PolymarketConnector(BaseConnector):
                                                     no_price=round(1 - mid, 4),
                                                     yes_bid=bid,
                                                     yes_ask=ask,
-                                                    last_updated=datetime.now(UTC),
+                                                    last_updated=received_at,
                                                 ),
                                             )
 
@@ -1047,6 +1085,33 @@ class PolymarketConnector(BaseConnector):
                 await asyncio.sleep(reconnect_delay)
                 reconnect_delay = min(reconnect_delay * 2, max_delay)  # Exponential backoff
 
+    async def update_subscriptions(self, asset_ids: set[str], shard: int = 0) -> None:
+        """Change a shard's price WS subscription in place, without reconnecting.
+
+        Sends subscribe/unsubscribe frames for the difference from the current
+        set. With no open socket only the set is updated; the next connect
+        subscribes to all of it.
+        """
+        current = self._ws_asset_ids.get(shard, set())
+        added = asset_ids - current
+        removed = current - asset_ids
+        self._ws_asset_ids[shard] = set(asset_ids)
+        ws = self._ws.get(shard)
+        if ws is None or not (added or removed):
+            return
+        if added:
+            await ws.send(json.dumps({
+                "assets_ids": list(added),
+                "operation": "subscribe",
+                "custom_feature_enabled": True,
+            }))
+        if removed:
+            await ws.send(json.dumps({
+                "assets_ids": list(removed),
+                "operation": "unsubscribe",
+            }))
+        logger.info("Polymarket WS[%d]: +%d / -%d tokens", shard, len(added), len(removed))
+
     # ========== TRADING METHODS ==========
 
     def _ensure_trading_client(self):
@@ -0,0 +1,56 @@
+"""Async rate limiter combining a concurrency cap with a request-rate window."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+
+
+class RateLimiter:
+    """Caps in-flight requests and requests started per time window.
+
+    Used as ``async with limiter:`` around one API call. A request waits for a
+    free concurrency slot, then for room in the sliding window, so bursts fill
+    the allowed rate instead of tripping 429s and retry backoff. With
+    max_concurrent=None only the rate applies, so a slow response never holds
+    up requests behind it.
+    """
+
+    def __init__(self, max_concurrent: int | None, max_requests: int, period: float = 1.0):
+        self._sem = asyncio.Semaphore(max_concurrent) if max_concurrent else None
+        self._max_requests = max_requests
+        self._period = period
+        self._starts: deque[float] = deque()  # monotonic start times inside the window
+        self.granted = 0    # requests let through
+        self.throttled = 0  # requests that had to wait for the rate window
+
+    async def __aenter__(self) -> RateLimiter:
+        if self._sem:
+            await self._sem.acquire()
+        try:
+            waited = False
+            while True:
+                now = time.monotonic()
+                while self._starts and now - self._starts[0] >= self._period:
+                    self._starts.popleft()
+                if len(self._starts) < self._max_requests:
+                    break
+                waited = True
+                await asyncio.sleep(self._period - (now - self._starts[0]))
+        except BaseException:
+            if self._sem:
+                self._sem.release()
+            raise
+        self._starts.append(now)
+        self.granted += 1
+        self.throttled += waited
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        if self._sem:
+            self._sem.release()
+
+    def stats(self) -> dict[str, int]:
+        """Counters for observability."""
+        return {"granted": self.granted, "throttled": self.throttled}
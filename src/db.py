@@ -99,6 +99,44 @@ _MIGRATION_ADD_LIFETIME = [
 ]
 
 
+_UPDATE_OPP_SQL = """UPDATE opportunities
+   SET yes_price = ?, no_price = ?, total_cost = ?,
+       profit_pct = ?, roi_after_fees = ?,
+       found_at = ?, details = ?, sport = ?,
+       last_seen = ?
+   WHERE id = ?"""
+
+_INSERT_OPP_SQL = """INSERT OR REPLACE INTO opportunities
+   (id, event_title, team_a, team_b, platform_buy_yes, platform_buy_no,
+    yes_price, no_price, total_cost, profit_pct, roi_after_fees,
+    found_at, still_active, details, sport,
+    first_seen, last_seen)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _opp_update_row(opp: ArbitrageOpportunity, sport: str, now_iso: str) -> tuple:
+    """Parameters for _UPDATE_OPP_SQL (opp.id must be set)."""
+    return (
+        opp.yes_price, opp.no_price, opp.total_cost,
+        opp.profit_pct, opp.roi_after_fees,
+        opp.found_at.isoformat(), json.dumps(opp.details),
+        sport, now_iso, opp.id,
+    )
+
+
+def _opp_insert_row(opp: ArbitrageOpportunity, sport: str, now_iso: str) -> tuple:
+    """Parameters for _INSERT_OPP_SQL (opp.id must be set)."""
+    return (
+        opp.id, opp.event_title, opp.team_a, opp.team_b,
+        opp.platform_buy_yes.value, opp.platform_buy_no.value,
+        opp.yes_price, opp.no_price, opp.total_cost,
+        opp.profit_pct, opp.roi_after_fees,
+        opp.found_at.isoformat(), int(opp.still_active),
+        json.dumps(opp.details), sport,
+        now_iso, now_iso,
+    )
+
+
 class Database:
     def __init__(self, db_path: str = ""):
         self.db_path = db_path or settings.db_path
@@ -231,48 +269,68 @@ class Database:
     async def save_opportunity(self, opp: ArbitrageOpportunity, sport: str = "") -> str:
         now_iso = datetime.utcnow().isoformat()
         # Dedup: update existing active arb for same key instead of inserting
-        existing = await self.find_active_by_key(
-            opp.team_a, opp.platform_buy_yes.value, opp.platform_buy_no.value,
-        )
+        existing = await self.find_active_by_key(*opp.arb_key)
         if existing:
             opp.id = existing["id"]
-            await self._db.execute(
-                """UPDATE opportunities
-                   SET yes_price = ?, no_price = ?, total_cost = ?,
-                       profit_pct = ?, roi_after_fees = ?,
-                       found_at = ?, details = ?, sport = ?,
-                       last_seen = ?
-                   WHERE id = ?""",
-                (
-                    opp.yes_price, opp.no_price, opp.total_cost,
-                    opp.profit_pct, opp.roi_after_fees,
-                    opp.found_at.isoformat(), json.dumps(opp.details),
-                    sport, now_iso, opp.id,
-                ),
-            )
+            await self._db.execute(_UPDATE_OPP_SQL, _opp_update_row(opp, sport, now_iso))
             return opp.id
 
         if not opp.id:
             opp.id = uuid.uuid4().hex[:12]
-        await self._db.execute(
-            """INSERT OR REPLACE INTO opportunities
-               (id, event_title, team_a, team_b, platform_buy_yes, platform_buy_no,
-                yes_price, no_price, total_cost, profit_pct, roi_after_fees,
-                found_at, still_active, details, sport,
-                first_seen, last_seen)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                opp.id, opp.event_title, opp.team_a, opp.team_b,
-                opp.platform_buy_yes.value, opp.platform_buy_no.value,
-                opp.yes_price, opp.no_price, opp.total_cost,
-                opp.profit_pct, opp.roi_after_fees,
-                opp.found_at.isoformat(), int(opp.still_active),
-                json.dumps(opp.details), sport,
-                now_iso, now_iso,
-            ),
-        )
+        await self._db.execute(_INSERT_OPP_SQL, _opp_insert_row(opp, sport, now_iso))
         return opp.id
 
+    async def save_opportunities(
+        self,
+        items: list[tuple[ArbitrageOpportunity, str]],
+        active: dict[tuple[str, str, str], str] | None = None,
+    ) -> list[str]:
+        """Save many (opportunity, sport) pairs with one lookup and two executemany calls.
+
+        Same dedup rule as save_opportunity: an active row with the same
+        (team_a, platform_yes, platform_no) key is updated in place.
+        A caller that tracks active keys itself can pass that key -> id map
+        as `active`: the lookup query is skipped, and new keys are added to it
+        once the writes have gone through (it is left as-is if they raise).
+        Returns the opportunity ids in input order.
+        """
+        if not items:
+            return []
+        now_iso = datetime.utcnow().isoformat()
+        if active is None:
+            # Ascending found_at so the newest row wins per key (like find_active_by_key)
+            cursor = await self._db.execute(
+                """SELECT id, team_a, platform_buy_yes, platform_buy_no FROM opportunities
+                   WHERE still_active = 1 ORDER BY found_at"""
+            )
+            active = {
+                (r["team_a"], r["platform_buy_yes"], r["platform_buy_no"]): r["id"]
+                for r in await cursor.fetchall()
+            }
+
+        inserts: list[tuple] = []
+        updates: list[tuple] = []
+        added: dict[tuple[str, str, str], str] = {}
+        for opp, sport in items:
+            key = opp.arb_key
+            existing_id = active.get(key) or added.get(key)
+            if existing_id:
+                opp.id = existing_id
+                updates.append(_opp_update_row(opp, sport, now_iso))
+            else:
+                if not opp.id:
+                    opp.id = uuid.uuid4().hex[:12]
+                added[key] = opp.id
+                inserts.append(_opp_insert_row(opp, sport, now_iso))
+
+        # Inserts first: a later item in the batch may update a row inserted here
+        if inserts:
+            await self._db.executemany(_INSERT_OPP_SQL, inserts)
+        if updates:
+            await self._db.executemany(_UPDATE_OPP_SQL, updates)
+        active.update(added)
+        return [opp.id for opp, _ in items]
+
     async def get_active_opportunities(self, limit: int = 50) -> list[dict]:
         cursor = await self._db.execute(
             """SELECT * FROM opportunities
@@ -322,6 +380,22 @@ class Database:
         )
         return cursor.rowcount
 
+    async def deactivate_by_keys(self, keys: list[tuple[str, str, str]]) -> int:
+        """Deactivate all active opportunities matching any of the given keys.
+
+        Keys are (team_a, platform_buy_yes, platform_buy_no). Does not commit.
+        """
+        if not keys:
+            return 0
+        now_iso = datetime.utcnow().isoformat()
+        cursor = await self._db.executemany(
+            """UPDATE opportunities SET still_active = 0, deactivated_at = ?
+               WHERE still_active = 1
+                 AND team_a = ? AND platform_buy_yes = ? AND platform_buy_no = ?""",
+            [(now_iso, *key) for key in keys],
+        )
+        return cursor.rowcount
+
     async def deactivate_all_active(self) -> int:
         """Deactivate ALL currently active opportunities (used on startup)."""
         now_iso = datetime.utcnow().isoformat()
@@ -460,6 +534,21 @@ class Database:
             (opp_id, roi, now_iso),
         )
 
+    async def snapshot_active_roi(self, limit: int = 200) -> int:
+        """Record a ROI snapshot for each of the newest `limit` active opportunities.
+
+        One INSERT ... SELECT instead of reading the rows back and inserting
+        them one by one. Does not commit.
+        """
+        now_iso = datetime.utcnow().isoformat()
+        cursor = await self._db.execute(
+            """INSERT INTO roi_snapshots (opp_id, roi, snapped_at)
+               SELECT id, COALESCE(roi_after_fees, 0), ? FROM opportunities
+               WHERE still_active = 1 ORDER BY found_at DESC LIMIT ?""",
+            (now_iso, limit),
+        )
+        return cursor.rowcount
+
     async def get_roi_history(self, opp_id: str) -> list[dict]:
         """Return ROI time series for an opportunity."""
         cursor = await self._db.execute(
@@ -630,6 +719,23 @@ class Database:
         await self._db.commit()
         return cursor.lastrowid
 
+    async def save_executor_trades(self, trades: list[dict]) -> None:
+        """Save many trades (save_executor_trade keyword dicts) in one commit."""
+        if not trades:
+            return
+        await self._db.executemany(
+            """INSERT INTO executor_trades (event_title, status, bet_size, pnl, roi, poly_order_id, kalshi_order_id, details)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    t["event_title"], t["status"], t["bet_size"], t.get("pnl", 0), t.get("roi"),
+                    t.get("poly_order_id"), t.get("kalshi_order_id"), json.dumps(t.get("details") or {}),
+                )
+                for t in trades
+            ],
+        )
+        await self._db.commit()
+
     async def get_executor_trades(self, limit: int = 50) -> list[dict]:
         """Get recent executor trades."""
         cursor = await self._db.execute(
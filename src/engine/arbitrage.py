@@ -137,14 +137,26 @@ def calculate_arbitrage(
         event: The matched sport event to check
         allow_live: Override for live mode. If None, uses settings.allow_live_arbs
     """
-    poly_market = event.markets.get(Platform.POLYMARKET)
-    kalshi_market = event.markets.get(Platform.KALSHI)
+    poly_market = event.poly_market
+    kalshi_market = event.kalshi_market
 
     if not poly_market or not kalshi_market:
         return None
     if not poly_market.price or not kalshi_market.price:
         return None
 
+    # Skip markets with insufficient liquidity — need volume on BOTH platforms.
+    # Checked first: it is the cheapest rejection and avoids the datetime
+    # parsing and price copies below for the bulk of illiquid events.
+    poly_vol = poly_market.price.volume
+    kalshi_vol = kalshi_market.price.volume
+    if (poly_vol or 0) == 0 or (kalshi_vol or 0) == 0:
+        return None
+    combined_vol = (poly_vol or 0) + (kalshi_vol or 0)
+    # Q3: Minimum volume threshold (lowered for more candidates)
+    if combined_vol < 100:
+        return None
+
     # Determine if live mode is enabled
     live_enabled = allow_live if allow_live is not None else settings.allow_live_arbs
 
@@ -183,16 +195,6 @@ def calculate_arbitrage(
     # Get map number for esports
     map_number = poly_market.map_number or kalshi_market.map_number
 
-    # Skip markets with insufficient liquidity — need volume on BOTH platforms
-    poly_vol = poly_market.price.volume if poly_market.price else 0
-    kalshi_vol = kalshi_market.price.volume if kalshi_market.price else 0
-    if (poly_vol or 0) == 0 or (kalshi_vol or 0) == 0:
-        return None
-    combined_vol = (poly_vol or 0) + (kalshi_vol or 0)
-    # Q3: Minimum volume threshold (lowered for more candidates)
-    if combined_vol < 100:
-        return None
-
     # Compute bid-ask spread percentage for liquidity check
     spread_pct = None
     if pp.yes_bid is not None and pp.yes_ask is not None and pp.yes_ask > 0:
@@ -73,8 +73,8 @@ def analyze_arbitrage_liquidity(
     Returns:
         LiquidityAnalysis with max executable sizes, or None if insufficient data
     """
-    poly_market = event.markets.get(Platform.POLYMARKET)
-    kalshi_market = event.markets.get(Platform.KALSHI)
+    poly_market = event.poly_market
+    kalshi_market = event.kalshi_market
 
     if not poly_market or not kalshi_market:
         return None
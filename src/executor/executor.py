@@ -182,7 +182,7 @@ class Executor:
             poly_order_id=result.poly_leg.order_id or "",
             kalshi_side="no" if opp.platform_buy_no.value == "kalshi" else "yes",
             kalshi_amount=result.kalshi_leg.filled_cost,
-            kalshi_contracts=int(result.kalshi_leg.filled_shares),
+            kalshi_contracts=result.kalshi_leg.filled_contracts,
             kalshi_avg_price=result.kalshi_leg.filled_price,
             kalshi_order_id=result.kalshi_leg.order_id or "",
             arb_type=opp.details.get("arb_type", "yes_no"),
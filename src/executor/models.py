@@ -26,6 +26,7 @@ class LegResult:
     filled_price: float     # Average fill price
     filled_cost: float      # Total dollars spent (shares × price)
     error: str | None = None
+    filled_contracts: int = 0  # Whole contracts filled (Kalshi legs only)
 
 
 @dataclass
@@ -332,6 +332,7 @@ class OrderPlacer:
                 filled_price=avg_price,
                 filled_cost=filled_cost,
                 error=result.get("error") if not success else None,
+                filled_contracts=filled_contracts,
             )
         except Exception as e:
             logger.error(f"Kalshi order failed: {e}")
@@ -397,7 +398,7 @@ class OrderPlacer:
         Better to fail rollback than sell at 1 cent.
         """
         try:
-            contracts = int(original_leg.filled_shares)
+            contracts = original_leg.filled_contracts
 
             # Use 20% of original price as floor (lose max 80%, not 99%)
             # This gives better chance of fill while limiting loss
@@ -431,6 +432,7 @@ class OrderPlacer:
                 filled_price=avg_price,
                 filled_cost=filled_cost,
                 error=result.get("error") if not success else None,
+                filled_contracts=filled_contracts,
             )
         except Exception as e:
             logger.error(f"Kalshi rollback failed: {e}")
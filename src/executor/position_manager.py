@@ -46,6 +46,8 @@ class PositionManager:
     def __init__(self, db_path: str = ""):
         self.db_path = db_path
         self._db: aiosqlite.Connection | None = None
+        # Open positions as last read; dropped whenever a position is written
+        self._open_cache: list[OpenPosition] | None = None
 
     async def connect(self) -> None:
         """Initialize database connection."""
@@ -87,6 +89,7 @@ class PositionManager:
             ),
         )
         await self._db.commit()
+        self._open_cache = None
 
     async def get_position(self, position_id: str) -> OpenPosition | None:
         """Get position by ID."""
@@ -99,12 +102,18 @@ class PositionManager:
         return self._row_to_position(row)
 
     async def get_open_positions(self) -> list[OpenPosition]:
-        """Get all open (unsettled) positions."""
-        cursor = await self._db.execute(
-            "SELECT * FROM positions WHERE status = 'open' ORDER BY opened_at"
-        )
-        rows = await cursor.fetchall()
-        return [self._row_to_position(row) for row in rows]
+        """Get all open (unsettled) positions.
+
+        Served from memory until the next save/settle, so repeated /trades
+        and settlement checks don't re-query the table.
+        """
+        if self._open_cache is None:
+            cursor = await self._db.execute(
+                "SELECT * FROM positions WHERE status = 'open' ORDER BY opened_at"
+            )
+            rows = await cursor.fetchall()
+            self._open_cache = [self._row_to_position(row) for row in rows]
+        return list(self._open_cache)
 
     async def settle_position(
         self,
@@ -125,6 +134,7 @@ class PositionManager:
             (datetime.now(UTC).isoformat(), actual_pnl, winning_side, position_id),
         )
         await self._db.commit()
+        self._open_cache = None
 
     async def get_daily_stats(self, day: date | None = None) -> dict:
         """Get statistics for a specific day."""
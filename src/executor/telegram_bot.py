@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
+import hmac
 import logging
-from datetime import datetime, UTC
 
 from telegram import Bot, Update
-from telegram.ext import Application, CommandHandler, ContextTypes
+from telegram.ext import Application, CommandHandler, ContextTypes, filters
 
 from src.executor.models import ExecutionResult, ExecutionStatus
 
@@ -16,9 +16,17 @@ logger = logging.getLogger(__name__)
 class TelegramNotifier:
     """Sends notifications and handles commands via Telegram."""
 
-    def __init__(self, bot_token: str, chat_id: str):
+    def __init__(
+        self,
+        bot_token: str,
+        chat_id: str,
+        webhook_url: str = "",
+        webhook_secret: str = "",
+    ):
         self.bot_token = bot_token
         self.chat_id = chat_id
+        self.webhook_url = webhook_url
+        self.webhook_secret = webhook_secret
         self._bot: Bot | None = None
         self._app: Application | None = None
 
@@ -134,7 +142,7 @@ class TelegramNotifier:
 
         if result.kalshi_leg.success:
             msg += (
-                f"\nKalshi: ✅ {int(result.kalshi_leg.filled_shares)} contracts "
+                f"\nKalshi: ✅ {result.kalshi_leg.filled_contracts} contracts "
                 f"× ${result.kalshi_leg.filled_price:.2f} = ${result.kalshi_leg.filled_cost:.2f}"
             )
         else:
@@ -185,23 +193,65 @@ class TelegramNotifier:
 
         self._app = Application.builder().token(self.bot_token).build()
 
-        self._app.add_handler(CommandHandler("status", self._cmd_status))
-        self._app.add_handler(CommandHandler("stop", self._cmd_stop))
-        self._app.add_handler(CommandHandler("start", self._cmd_start))
-        self._app.add_handler(CommandHandler("trades", self._cmd_trades))
-        self._app.add_handler(CommandHandler("pnl", self._cmd_pnl))
+        # Commands control live trading: only the configured chat may send them
+        # (with no chat_id configured, the filter matches nothing)
+        try:
+            only_owner = filters.Chat(chat_id=int(self.chat_id))
+        except ValueError:
+            # "@channel"-style chat ids are matched by username
+            only_owner = filters.Chat(username=self.chat_id or None)
+        self._app.add_handler(CommandHandler("status", self._cmd_status, filters=only_owner))
+        self._app.add_handler(CommandHandler("stop", self._cmd_stop, filters=only_owner))
+        self._app.add_handler(CommandHandler("start", self._cmd_start, filters=only_owner))
+        self._app.add_handler(CommandHandler("trades", self._cmd_trades, filters=only_owner))
+        self._app.add_handler(CommandHandler("pnl", self._cmd_pnl, filters=only_owner))
 
         await self._app.initialize()
         await self._app.start()
-        await self._app.updater.start_polling()
+        if self.webhook_url and not self.webhook_secret:
+            logger.error(
+                "TELEGRAM_WEBHOOK_URL is set without TELEGRAM_WEBHOOK_SECRET — "
+                "webhook disabled, falling back to polling"
+            )
+            self.webhook_url = ""
+        if self.webhook_url:
+            # Telegram pushes updates to /api/telegram/webhook — no idle polling
+            await self._app.bot.set_webhook(
+                url=self.webhook_url,
+                allowed_updates=["message"],
+                secret_token=self.webhook_secret,
+            )
+        else:
+            await self._app.updater.start_polling()
 
     async def stop_commands(self) -> None:
         """Stop the bot command handlers."""
         if self._app:
-            await self._app.updater.stop()
+            if self.webhook_url:
+                # Otherwise Telegram keeps posting updates to an endpoint that is gone
+                try:
+                    await self._app.bot.delete_webhook()
+                except Exception as e:
+                    logger.warning(f"Failed to delete Telegram webhook: {e}")
+            if self._app.updater and self._app.updater.running:
+                await self._app.updater.stop()
             await self._app.stop()
             await self._app.shutdown()
 
+    async def process_webhook_update(self, data: dict, secret: str | None = None) -> bool:
+        """Queue an update received on the webhook endpoint.
+
+        Returns False if commands are not running, webhook mode is off, or
+        the secret does not match. A secret is always required: the endpoint
+        is reachable by anyone who can reach the dashboard.
+        """
+        if self._app is None or not self.webhook_url or not self.webhook_secret:
+            return False
+        if secret is None or not hmac.compare_digest(secret.encode(), self.webhook_secret.encode()):
+            return False
+        await self._app.update_queue.put(Update.de_json(data, self._app.bot))
+        return True
+
     async def _cmd_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /status command."""
         stats = self._executor.risk.get_stats()
@@ -246,9 +296,11 @@ class TelegramNotifier:
             await update.message.reply_text("No open positions")
             return
 
-        msg = "📜 <b>OPEN POSITIONS</b>\n━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        for pos in positions[:10]:
-            msg += f"• {pos.event_title}\n  ROI: {pos.expected_roi:.1f}%\n"
+        lines = ["📜 <b>OPEN POSITIONS</b>\n━━━━━━━━━━━━━━━━━━━━━━━━━\n"]
+        lines.extend(
+            f"• {pos.event_title}\n  ROI: {pos.expected_roi:.1f}%\n" for pos in positions[:10]
+        )
+        msg = "".join(lines)
 
         await update.message.reply_text(msg, parse_mode="HTML")
 
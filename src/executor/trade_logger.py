@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, UTC
 from typing import TYPE_CHECKING
@@ -12,16 +13,27 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Max trades written per executemany batch
+_TRADE_BATCH_SIZE = 16
+# Backoff between attempts to save a failed batch (seconds, doubling up to the cap)
+_RETRY_DELAY = 0.5
+_MAX_RETRY_DELAY = 30.0
+
 
 class TradeLogger:
     """Logs trades and manages positions with DB persistence.
 
     Integrates with WebSocket handler for real-time dashboard updates.
+    Trades are queued and written by a background task so logging never
+    holds up order placement on a DB commit. A batch that fails to save is
+    retried until it succeeds; trades are never dropped from the queue.
     """
 
     def __init__(self, db: Database, ws_handler: ExecutorWSHandler | None = None):
         self._db = db
         self._ws = ws_handler
+        self._pending: asyncio.Queue[dict] = asyncio.Queue()
+        self._writer: asyncio.Task | None = None
 
     def set_ws_handler(self, ws_handler: ExecutorWSHandler) -> None:
         """Set WebSocket handler after initialization."""
@@ -37,8 +49,12 @@ class TradeLogger:
         poly_order_id: str | None = None,
         kalshi_order_id: str | None = None,
         details: dict | None = None,
-    ) -> int:
-        """Log a trade execution.
+    ) -> None:
+        """Queue a trade execution for logging.
+
+        The DB write and dashboard broadcast happen in a background writer,
+        in submission order. Use flush() to wait until queued trades are saved.
+        No DB row id is returned: nothing looks trades up by id.
 
         Args:
             event_title: Name of the event (e.g., "Lakers vs Celtics")
@@ -49,35 +65,78 @@ class TradeLogger:
             poly_order_id: Polymarket order ID
             kalshi_order_id: Kalshi order ID
             details: Additional trade details
-
-        Returns:
-            Trade ID from database.
         """
-        trade_id = await self._db.save_executor_trade(
-            event_title=event_title,
-            status=status,
-            bet_size=bet_size,
-            pnl=pnl,
-            roi=roi,
-            poly_order_id=poly_order_id,
-            kalshi_order_id=kalshi_order_id,
-            details=details,
-        )
-
-        logger.info(f"Logged trade: {event_title} | {status} | ${bet_size} | PnL=${pnl}")
-
-        # Broadcast to WebSocket clients
-        if self._ws:
-            await self._ws.broadcast_trade_event(
-                event_title=event_title,
-                status=status,
-                bet_size=bet_size,
-                pnl=pnl,
-                roi=roi,
-                details=details,
-            )
-
-        return trade_id
+        self._pending.put_nowait({
+            "event_title": event_title,
+            "status": status,
+            "bet_size": bet_size,
+            "pnl": pnl,
+            "roi": roi,
+            "poly_order_id": poly_order_id,
+            "kalshi_order_id": kalshi_order_id,
+            "details": details,
+        })
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_trades())
+
+    async def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all queued trades are written.
+
+        Returns False if timeout expired first (the DB is still failing);
+        the unsaved trades stay queued and were logged by the writer.
+        """
+        if self._writer is None or self._writer.done():
+            return True
+        try:
+            async with asyncio.timeout(timeout):
+                await self._pending.join()
+        except TimeoutError:
+            logger.error(f"{self._pending.qsize()} queued trade(s) not saved yet")
+            return False
+        return True
+
+    async def _write_trades(self) -> None:
+        """Background writer: save queued trades in batches, then broadcast them."""
+        while True:
+            batch = [await self._pending.get()]
+            while len(batch) < _TRADE_BATCH_SIZE and not self._pending.empty():
+                batch.append(self._pending.get_nowait())
+
+            delay = _RETRY_DELAY
+            while True:
+                try:
+                    await self._db.save_executor_trades(batch)
+                    break
+                except Exception:
+                    # Full trade data in the log, so the audit record survives
+                    # even if the process dies before a retry succeeds
+                    logger.exception(
+                        f"Failed to log {len(batch)} trade(s), retrying in {delay:.1f}s: {batch}"
+                    )
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, _MAX_RETRY_DELAY)
+
+            try:
+                for trade in batch:
+                    logger.info(
+                        f"Logged trade: {trade['event_title']} | {trade['status']} | "
+                        f"${trade['bet_size']} | PnL=${trade['pnl']}"
+                    )
+                    # Broadcast to WebSocket clients
+                    if self._ws:
+                        await self._ws.broadcast_trade_event(
+                            event_title=trade["event_title"],
+                            status=trade["status"],
+                            bet_size=trade["bet_size"],
+                            pnl=trade["pnl"],
+                            roi=trade["roi"],
+                            details=trade["details"],
+                        )
+            except Exception:
+                logger.exception(f"Failed to broadcast {len(batch)} trade(s)")
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
 
     async def open_position(
         self,
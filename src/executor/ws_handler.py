@@ -5,16 +5,32 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 from fastapi import WebSocket, WebSocketDisconnect
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
 if TYPE_CHECKING:
     from src.db import Database
     from src.executor.settings_manager import ExecutorSettingsManager
 
 logger = logging.getLogger(__name__)
 
+# Init state is shared by connections opened within this window (seconds)
+_INIT_CACHE_TTL = 1.0
+
+
+def _dumps(message: dict) -> str:
+    """Serialize a message to a JSON text frame (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
 
 class ExecutorWSHandler:
     """Manages WebSocket connections for executor dashboard.
@@ -35,27 +51,33 @@ class ExecutorWSHandler:
         self.db = db
         self.poly = poly_connector
         self.kalshi = kalshi_connector
-        self._connections: set[WebSocket] = set()
+        # Copy-on-write: connect/disconnect swap in a new frozenset under the
+        # lock, broadcast reads the current snapshot without locking
+        self._connections: frozenset[WebSocket] = frozenset()
         self._lock = asyncio.Lock()
+        # (built_at monotonic, serialized init frame) and single-flight lock for rebuilding it
+        self._init_cache: tuple[float, str] | None = None
+        self._init_lock = asyncio.Lock()
+        # Bumped by every broadcast; a rebuild that raced one is not cached
+        self._init_generation = 0
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept new WebSocket connection and send initial state."""
         await websocket.accept()
         async with self._lock:
-            self._connections.add(websocket)
+            self._connections = self._connections | {websocket}
         logger.info(f"Executor WS connected, total: {len(self._connections)}")
 
         # Send initial state
         try:
-            init_data = await self._get_init_state()
-            await websocket.send_json({"type": "init", "data": init_data})
+            await websocket.send_text(await self._get_init_payload())
         except Exception as e:
             logger.error(f"Failed to send init state: {e}")
 
     async def disconnect(self, websocket: WebSocket) -> None:
         """Handle WebSocket disconnection."""
         async with self._lock:
-            self._connections.discard(websocket)
+            self._connections = self._connections - {websocket}
         logger.info(f"Executor WS disconnected, total: {len(self._connections)}")
 
     async def handle_message(self, websocket: WebSocket, message: dict) -> None:
@@ -108,19 +130,42 @@ class ExecutorWSHandler:
             logger.error(f"WS error: {e}")
             await self.disconnect(websocket)
 
-    async def _get_init_state(self) -> dict:
+    async def _get_init_payload(self) -> str:
+        """Return the serialized init frame for a new connection, cached briefly.
+
+        A reconnect storm (e.g. after deploy) shares one DB + balance fan-out
+        and one JSON encode instead of running them once per connection.
+        Any broadcast invalidates the cache, since it signals a state change;
+        a payload whose rebuild overlapped a broadcast is served but not cached.
+        """
+        cache = self._init_cache
+        if cache and time.monotonic() - cache[0] < _INIT_CACHE_TTL:
+            return cache[1]
+        async with self._init_lock:
+            cache = self._init_cache
+            if cache and time.monotonic() - cache[0] < _INIT_CACHE_TTL:
+                return cache[1]
+            generation = self._init_generation
+            payload = _dumps({"type": "init", "data": await self._build_init_state()})
+            if generation == self._init_generation:
+                self._init_cache = (time.monotonic(), payload)
+            return payload
+
+    async def _build_init_state(self) -> dict:
         """Build initial state for new connection."""
         settings = self.settings.get()
 
-        # Get balances
+        # Get balances (both platforms concurrently)
         balances = {"poly": 0.0, "kalshi": 0.0}
-        try:
-            if self.poly:
-                balances["poly"] = await self.poly.get_balance()
-            if self.kalshi:
-                balances["kalshi"] = await self.kalshi.get_balance()
-        except Exception as e:
-            logger.warning(f"Failed to fetch balances: {e}")
+        sources = [(k, c) for k, c in (("poly", self.poly), ("kalshi", self.kalshi)) if c]
+        results = await asyncio.gather(
+            *(c.get_balance() for _, c in sources), return_exceptions=True
+        )
+        for (key, _), result in zip(sources, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to fetch {key} balance: {result}")
+            else:
+                balances[key] = result
 
         # Get daily stats
         stats = await self.db.get_daily_executor_stats()
@@ -147,20 +192,28 @@ class ExecutorWSHandler:
         }
 
     async def broadcast(self, message: dict) -> None:
-        """Send message to all connected clients."""
-        if not self._connections:
+        """Send message to all connected clients.
+
+        Sends run concurrently on a lock-free snapshot of the connections, so
+        one slow client does not delay the others. The payload is serialized
+        once for all clients.
+        """
+        self._init_cache = None
+        self._init_generation += 1
+        conns = self._connections
+        if not conns:
             return
 
-        disconnected = set()
-        async with self._lock:
-            for ws in self._connections:
-                try:
-                    await ws.send_json(message)
-                except Exception:
-                    disconnected.add(ws)
-
-            # Clean up disconnected clients
-            self._connections -= disconnected
+        payload = _dumps(message)
+        results = await asyncio.gather(
+            *(ws.send_text(payload) for ws in conns), return_exceptions=True
+        )
+        disconnected = {ws for ws, r in zip(conns, results) if isinstance(r, Exception)}
+
+        # Clean up disconnected clients
+        if disconnected:
+            async with self._lock:
+                self._connections = self._connections - disconnected
 
     async def broadcast_balance_update(self, poly: float, kalshi: float) -> None:
         """Broadcast balance update to all clients."""
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import random
 import signal
 import time
 from collections import defaultdict
@@ -12,10 +14,11 @@ import uvicorn
 from src.config import settings
 from src.connectors.kalshi import KalshiConnector
 from src.connectors.polymarket import PolymarketConnector
+from src.connectors.rate_limit import RateLimiter
 from src.db import db
 from src.engine.arbitrage import calculate_arbitrage, calculate_3way_arbitrage
 from src.engine.matcher import match_events, find_3way_groups
-from src.models import ArbitrageOpportunity, MarketPrice, Platform, SportEvent, ThreeWayGroup
+from src.models import ArbitrageOpportunity, Market, MarketPrice, SportEvent, ThreeWayGroup
 
 # Executor imports (conditional to avoid breaking if not configured)
 _executor = None  # Global executor instance
@@ -31,47 +34,94 @@ from src.state import app_state
 # Cache refresh intervals (seconds)
 KALSHI_CACHE_TTL = 600  # 10 minutes
 POLY_CACHE_TTL = 300    # 5 minutes
-MATCH_CACHE_TTL = 300   # 5 minutes for matched events cache
-
-# Concurrency limiter for price fetches (increased from 15 for faster book fetches)
-_price_semaphore = asyncio.Semaphore(25)
+CACHE_TTL_JITTER = 0.1  # up to 10% of a TTL shaved off each refresh
+# Adaptive TTL: halved on game days, doubled when nothing is churning,
+# shortened further by match churn; always kept within these bounds
+MIN_CACHE_TTL = 60
+MAX_CACHE_TTL = 1800
+CHURN_EMA_ALPHA = 0.3   # weight of the latest re-match in the churn EMA
+STABLE_CHURN = 0.01     # churn below this counts as a stable market set
+# Stale-while-revalidate: an expired market list is served while a background
+# refresh runs; the scan only blocks on a fetch past this multiple of the TTL
+SWR_HARD_FACTOR = 2
+
+# Scan cadence backoff: 3 scans longer than 1.5x the interval double it (up to 8x poll_interval)
+SCAN_OVERRUN_FACTOR = 1.5
+MAX_INTERVAL_BACKOFF = 8
+
+# Polymarket price/book fetches: per-second request budget only, so slow tails
+# don't hold slots (in-flight requests are bounded by the httpx pool).
+# Kalshi calls are limited inside KalshiConnector (kalshi.rate_limiter).
+_poly_limiter = RateLimiter(max_concurrent=None, max_requests=settings.poly_max_requests_per_sec)
+# Order books have their own, larger budget on Polymarket's 10-second window,
+# so a scan's candidate books burst instead of queuing behind price fetches
+_poly_book_limiter = RateLimiter(
+    max_concurrent=None, max_requests=settings.poly_book_requests_per_10s, period=10.0,
+)
 
 # Token → event mapping for O(1) WS price application
 _token_to_event: dict[str, SportEvent] = {}
+# Set when ws_subscribed_ids changes; the WS listener then diff-subscribes
+_ws_subs_changed = asyncio.Event()
+# WS ticks are coalesced per token and applied to events at this interval
+WS_FLUSH_INTERVAL = 0.1
+# Background market-list refresh (stale-while-revalidate), collected by the
+# first scan after it finishes
+_market_prefetch: asyncio.Task | None = None
 
 
-async def _fetch_with_semaphore(coro, timeout: float = 5.0):
-    """Run a coroutine with semaphore-limited concurrency and timeout."""
-    async with _price_semaphore:
-        try:
-            return await asyncio.wait_for(coro, timeout=timeout)
-        except asyncio.TimeoutError:
-            logger.debug("Price fetch timed out after %.1fs", timeout)
-            return None
+async def _fetch_poly(coro, limiter: RateLimiter = _poly_limiter, timeout: float = 5.0):
+    """Run a Polymarket fetch under its endpoint's rate limiter, with a timeout."""
+    async with limiter:
+        return await _fetch_with_timeout(coro, timeout)
 
 
-def _is_valid_price(price: MarketPrice | None) -> bool:
-    """Check if a price looks real (not a 50/50 default placeholder)."""
-    if not price:
-        return False
-    # Exactly 0.5/0.5 with no bid/ask = placeholder (even with volume)
-    if (price.yes_price == 0.5
-            and price.no_price == 0.5
-            and price.yes_bid is None
-            and price.yes_ask is None):
-        return False
-    return True
+async def _fetch_with_timeout(coro, timeout: float):
+    """Await a fetch, returning None if it takes longer than timeout."""
+    try:
+        async with asyncio.timeout(timeout):
+            return await coro
+    except TimeoutError:
+        logger.debug("Price fetch timed out after %.1fs", timeout)
+        return None
 
 
-def _is_stale_event(event: SportEvent) -> bool:
+def _is_stale_event(event: SportEvent, today: date | None = None) -> bool:
     """Check if a game event's date is in the past."""
-    pm = event.markets.get(Platform.POLYMARKET)
-    km = event.markets.get(Platform.KALSHI)
-    # Use earliest available game_date from either platform
-    dates = [m.game_date for m in (pm, km) if m and m.game_date]
-    if dates and max(dates) < date.today():
-        return True
-    return False
+    game_date = event.game_date  # cached on the event
+    return game_date is not None and game_date < (today or date.today())
+
+
+def _is_arb_candidate(event: SportEvent, today: date | None = None) -> bool:
+    """Cheap pre-check before fetching prices: needs both platforms and a current game.
+
+    _process_sport_group drops everything else before calculating arbs.
+    """
+    if not (event.poly_market and event.kalshi_market):
+        return False
+    return not _is_stale_event(event, today)
+
+
+def _price_fresh_after() -> float | None:
+    """Monotonic cutoff after which a fetched price is reused (None if price_ttl is off)."""
+    return time.monotonic() - settings.price_ttl if settings.price_ttl > 0 else None
+
+
+def _has_fresh_price(pm: Market, fresh_after: float | None) -> bool:
+    """True if pm's CLOB price was fetched recently enough to skip re-fetching."""
+    return fresh_after is not None and pm.price_ts is not None and pm.price_ts > fresh_after
+
+
+async def _apply_poly_fetch(pm: Market, mid: str, coro) -> None:
+    """Run one individual Poly price fetch and store the result on the market."""
+    try:
+        result = await _fetch_poly(coro)
+    except Exception as e:
+        logger.warning("Price fetch error (poly, %.20s): %s", mid, e)
+        return
+    if result is not None:
+        pm.price = result
+        pm.price_ts = time.monotonic()
 
 
 async def fetch_and_update_prices(
@@ -82,80 +132,113 @@ async def fetch_and_update_prices(
     """Fetch latest prices for all matched events using batch/parallel fetching."""
     # Collect all price fetch tasks across all events
     # NOTE: Kalshi prices are already set during fetch_sports_events() — no re-fetch needed.
-    poly_normal_tokens: list[tuple[SportEvent, str]] = []  # (event, token_id)
-    poly_neg_risk_ids: list[tuple[SportEvent, str]] = []   # (event, market_id)
+    # Poly market looked up once per event; later passes reuse the reference
+    poly_normal_tokens: list[tuple[Market, str]] = []  # (poly market, token_id)
+    poly_neg_risk_ids: list[tuple[Market, str]] = []   # (poly market, market_id)
+    # Prices refreshed within price_ttl (by a WS tick or the previous fast
+    # scan) are reused
+    fresh_after = _price_fresh_after()
+    reused = 0
 
     for event in events:
-        pm = event.markets.get(Platform.POLYMARKET)
+        pm = event.poly_market
 
         if pm:
-            token_ids = pm.raw_data.get("clob_token_ids", [])
-            price_id = token_ids[0] if token_ids else pm.market_id
-            is_neg_risk = pm.raw_data.get("neg_risk", False)
-            if is_neg_risk:
-                poly_neg_risk_ids.append((event, price_id))
+            if _has_fresh_price(pm, fresh_after):
+                reused += 1
+                continue
+            price_id = pm.primary_token_id or pm.market_id
+            if pm.neg_risk:
+                poly_neg_risk_ids.append((pm, price_id))
             else:
-                poly_normal_tokens.append((event, price_id))
+                poly_normal_tokens.append((pm, price_id))
+
+    # Individual fetches for negRisk Poly markets + missing batch results.
+    # negRisk tasks are started before awaiting the batch call so both
+    # overlap instead of paying batch RTT + individual RTT back to back.
+    # Each task stores its own result, so there is no post-gather apply pass.
+    individual_count = 0
+    async with asyncio.TaskGroup() as tg:
+        for pm, market_id in poly_neg_risk_ids:
+            tg.create_task(_apply_poly_fetch(
+                pm, market_id,
+                poly.fetch_price(market_id, neg_risk=True, clob_token_id=pm.primary_token_id),
+            ))
+        individual_count += len(poly_neg_risk_ids)
+
+        # Batch fetch: Polymarket normal tokens via batch API
+        batch_prices = {}
+        if poly_normal_tokens:
+            # A token shared by several events is requested once
+            all_token_ids = list(dict.fromkeys(tid for _, tid in poly_normal_tokens))
+            try:
+                batch_prices = await poly.fetch_prices_batch(all_token_ids)
+                logger.info("Batch fetched %d/%d Poly prices", len(batch_prices), len(all_token_ids))
+            except Exception:
+                logger.exception("Batch price fetch failed, falling back to individual")
+
+        # Apply batch results to events (preserve volume from Gamma); tokens
+        # missing from the batch with no price yet are fetched individually
+        batch_ts = time.monotonic()
+        for pm, token_id in poly_normal_tokens:
+            new_price = batch_prices.get(token_id)
+            if new_price is not None:
+                # Preserve volume from Gamma API since CLOB /prices doesn't return volume
+                if pm.price and pm.price.volume:
+                    new_price.volume = pm.price.volume
+                pm.price = new_price
+                pm.price_ts = batch_ts
+            elif pm.price is None:
+                tg.create_task(_apply_poly_fetch(
+                    pm, token_id, poly.fetch_price(token_id, neg_risk=False)
+                ))
+                individual_count += 1
+
+    if reused:
+        logger.info("Reused %d fresh Poly prices (WS or previous scan)", reused)
+    if individual_count:
+        logger.info("Individual price fetches: %d (negRisk + batch fallback)", individual_count)
+
+
+async def _apply_poly_book(pm: Market, coro) -> bool:
+    """Fetch one Poly order book and store it on the market. True if updated."""
+    try:
+        result = await _fetch_poly(coro, _poly_book_limiter)
+    except Exception as e:
+        logger.warning("Book fetch error (poly, %.20s): %s", pm.market_id, e)
+        return False
+    if result is None:
+        return False
+    if pm.price:
+        result.volume = pm.price.volume
+    pm.price = result
+    return True
 
-    # Batch fetch: Polymarket normal tokens via batch API
-    batch_prices = {}
-    if poly_normal_tokens:
-        all_token_ids = [tid for _, tid in poly_normal_tokens]
-        try:
-            batch_prices = await poly.fetch_prices_batch(all_token_ids)
-            logger.info(f"Batch fetched {len(batch_prices)}/{len(all_token_ids)} Poly prices")
-        except Exception:
-            logger.exception("Batch price fetch failed, falling back to individual")
-
-    # Apply batch results to events (preserve volume from Gamma)
-    for event, token_id in poly_normal_tokens:
-        pm = event.markets.get(Platform.POLYMARKET)
-        if pm and token_id in batch_prices:
-            new_price = batch_prices[token_id]
-            # Preserve volume from Gamma API since CLOB /prices doesn't return volume
-            if pm.price and pm.price.volume:
-                new_price.volume = pm.price.volume
-            pm.price = new_price
-
-    # Individual fetches for negRisk Poly markets + missing batch results + Kalshi
-    individual_tasks: list[tuple[str, SportEvent, str, asyncio.Task]] = []
-
-    for event, market_id in poly_neg_risk_ids:
-        pm = event.markets.get(Platform.POLYMARKET)
-        clob_ids = pm.raw_data.get("clob_token_ids", []) if pm else []
-        clob_token_id = clob_ids[0] if clob_ids else None
-        task = asyncio.ensure_future(
-            _fetch_with_semaphore(
-                poly.fetch_price(market_id, neg_risk=True, clob_token_id=clob_token_id)
-            )
-        )
-        individual_tasks.append(("poly", event, market_id, task))
-
-    # Fetch any Poly tokens that weren't in the batch result
-    for event, token_id in poly_normal_tokens:
-        pm = event.markets.get(Platform.POLYMARKET)
-        if pm and pm.price is None and token_id not in batch_prices:
-            task = asyncio.ensure_future(
-                _fetch_with_semaphore(poly.fetch_price(token_id, neg_risk=False))
-            )
-            individual_tasks.append(("poly", event, token_id, task))
 
-    if individual_tasks:
-        results = await asyncio.gather(
-            *[t[3] for t in individual_tasks], return_exceptions=True
-        )
-        for (label, event, mid, _), result in zip(individual_tasks, results):
-            if isinstance(result, Exception):
-                logger.warning(f"Price fetch error ({label}, {mid[:20]}): {result}")
-                continue
-            if result is None:
-                continue
-            if label == "poly":
-                pm = event.markets.get(Platform.POLYMARKET)
-                if pm:
-                    pm.price = result
+async def _apply_kalshi_prices(kalshi: KalshiConnector, markets: list[Market]) -> int:
+    """Batch-fetch fresh Kalshi prices and store them on the markets. Returns count updated.
+
+    Each price is stored as soon as its response lands, so one slow ticker
+    (or the timeout) doesn't hold back prices that already arrived.
+    """
+    by_ticker: dict[str, list[Market]] = defaultdict(list)
+    for km in markets:
+        by_ticker[km.market_id].append(km)
+    updated = 0
+
+    def _store(ticker: str, price: MarketPrice) -> None:
+        nonlocal updated
+        for km in by_ticker.get(ticker, ()):
+            km.price = price
+            updated += 1
 
-        logger.info(f"Individual price fetches: {len(individual_tasks)} (negRisk + batch fallback)")
+    try:
+        await _fetch_with_timeout(
+            kalshi.poll_active_markets(list(by_ticker), on_price=_store), timeout=10.0
+        )
+    except Exception as e:
+        logger.warning("Kalshi candidate price fetch failed: %s", e)
+    return updated
 
 
 async def fetch_books_for_candidates(
@@ -163,188 +246,212 @@ async def fetch_books_for_candidates(
     kalshi: KalshiConnector,
     candidates: list[SportEvent],
 ) -> None:
-    """Fetch order books for arb candidates: Polymarket books + fresh Kalshi prices."""
-    poly_tasks: list[tuple[SportEvent, asyncio.Task]] = []
-    kalshi_tasks: list[tuple[SportEvent, asyncio.Task]] = []
+    """Fetch order books for arb candidates: Polymarket books + fresh Kalshi prices.
 
+    Each fetch stores its result as soon as it arrives; one slow book does
+    not hold back applying the others. Every candidate's book is awaited:
+    stopping at the first good arb would drop the other arbs in the group.
+    """
+    poly_candidates: list[Market] = []
+    kalshi_candidates: list[Market] = []
     for event in candidates:
-        pm = event.markets.get(Platform.POLYMARKET)
+        pm = event.poly_market
         if pm:
-            token_ids = pm.raw_data.get("clob_token_ids", [])
-            token_id = token_ids[0] if token_ids else pm.market_id
-            task = asyncio.ensure_future(
-                _fetch_with_semaphore(poly.fetch_book(token_id))
-            )
-            poly_tasks.append((event, task))
-
-        km = event.markets.get(Platform.KALSHI)
+            poly_candidates.append(pm)
+        km = event.kalshi_market
         if km:
-            task = asyncio.ensure_future(
-                _fetch_with_semaphore(kalshi.fetch_price(km.market_id))
-            )
-            kalshi_tasks.append((event, task))
-
-    all_tasks = [t[1] for t in poly_tasks] + [t[1] for t in kalshi_tasks]
-    if not all_tasks:
+            kalshi_candidates.append(km)
+    if not poly_candidates and not kalshi_candidates:
         return
 
-    results = await asyncio.gather(*all_tasks, return_exceptions=True)
+    async with asyncio.TaskGroup() as tg:
+        poly_tasks = []
+        for pm in poly_candidates:
+            token_id = pm.primary_token_id or pm.market_id
+            poly_tasks.append(tg.create_task(_apply_poly_book(pm, poly.fetch_book(token_id))))
+        # One batched request for all candidate tickers, runs alongside the books
+        kalshi_task = (
+            tg.create_task(_apply_kalshi_prices(kalshi, kalshi_candidates))
+            if kalshi_candidates else None
+        )
 
-    # Apply Polymarket book results
-    poly_updated = 0
-    for i, (event, _) in enumerate(poly_tasks):
-        result = results[i]
-        if isinstance(result, Exception) or result is None:
-            continue
-        pm = event.markets.get(Platform.POLYMARKET)
-        if pm and pm.price:
-            result.volume = pm.price.volume
-            pm.price = result
-            poly_updated += 1
-        elif pm:
-            pm.price = result
-            poly_updated += 1
-
-    # Apply Kalshi fresh price results
-    kalshi_updated = 0
-    offset = len(poly_tasks)
-    for i, (event, _) in enumerate(kalshi_tasks):
-        result = results[offset + i]
-        if isinstance(result, Exception) or result is None:
-            continue
-        km = event.markets.get(Platform.KALSHI)
-        if km:
-            km.price = result
-            kalshi_updated += 1
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    poly_updated = sum(t.result() for t in poly_tasks)
+    kalshi_updated = kalshi_task.result() if kalshi_task else 0
 
     # Diagnostic: count candidates with real bid/ask data
-    poly_exec = 0
-    kalshi_exec = 0
-    for event, _ in poly_tasks:
-        pm = event.markets.get(Platform.POLYMARKET)
-        if pm and pm.price and pm.price.yes_bid is not None and pm.price.yes_ask is not None:
-            poly_exec += 1
-    for event, _ in kalshi_tasks:
-        km = event.markets.get(Platform.KALSHI)
-        if km and km.price and km.price.yes_bid is not None and km.price.yes_ask is not None:
-            kalshi_exec += 1
-
-    total = len(poly_tasks) or 1
+    poly_exec = sum(
+        1 for pm in poly_candidates
+        if pm.price and pm.price.yes_bid is not None and pm.price.yes_ask is not None
+    )
+    kalshi_exec = sum(
+        1 for km in kalshi_candidates
+        if km.price and km.price.yes_bid is not None and km.price.yes_ask is not None
+    )
+
+    total = len(poly_candidates) or 1
     logger.info(
-        f"Book fetch: {poly_updated}/{len(poly_tasks)} Poly books, "
-        f"{kalshi_updated}/{len(kalshi_tasks)} Kalshi prices refreshed | "
-        f"EXEC data: {poly_exec}/{total} Poly bid/ask, {kalshi_exec}/{total} Kalshi bid/ask"
+        "Book fetch: %d/%d Poly books, %d/%d Kalshi prices refreshed | "
+        "EXEC data: %d/%d Poly bid/ask, %d/%d Kalshi bid/ask",
+        poly_updated, len(poly_candidates), kalshi_updated, len(kalshi_candidates),
+        poly_exec, total, kalshi_exec, total,
     )
 
 
-def broadcast_event(event_type: str, data: dict) -> None:
+@functools.cache
+def _sse_broadcast():
+    """Resolve the SSE broadcaster once (deferred to avoid a circular import)."""
     from src.web.routes import broadcast_event as _broadcast
-    _broadcast(event_type, data)
+    return _broadcast
+
+
+def broadcast_event(event_type: str, data: dict) -> None:
+    _sse_broadcast()(event_type, data)
 
 
 async def ws_price_listener(poly: PolymarketConnector) -> None:
     """Background task: consume Polymarket WS price stream and update cache.
 
-    Reconnects when the subscription set changes (new matched events) or on
-    connection errors. The 5-min full refetch remains as fallback — WS is an
-    acceleration layer, not a replacement.
+    Tokens are split across settings.poly_ws_shards connections so bursts
+    are drained in parallel. Subscription changes (new matched events) are
+    sent on the open sockets; they are only reopened on connection errors.
+    The 5-min full refetch remains as fallback — WS is an acceleration
+    layer, not a replacement.
     """
-    _last_sub_snapshot: set[str] = set()
-
-    while app_state["running"]:
-        subscribed = app_state["ws_subscribed_ids"]
-        if not subscribed:
+    shards = max(1, settings.poly_ws_shards)
+    while app_state.running:
+        if not app_state.ws_subscribed_ids:
             await asyncio.sleep(2)
             continue
+        _ws_subs_changed.clear()
+        sync_task = asyncio.create_task(_sync_ws_subscriptions(poly, shards))
+        # Latest tick per token since the last flush (later ticks overwrite)
+        pending: dict[str, MarketPrice] = {}
+        flush_task = asyncio.create_task(_flush_ws_prices(pending))
         try:
-            token_list = list(subscribed)
-            _last_sub_snapshot = set(subscribed)
-            logger.info(f"Polymarket WS: subscribing to {len(token_list)} tokens")
-            async for token_id, price in poly.subscribe_prices(token_list):
-                if not app_state["running"]:
-                    break
-                app_state["ws_price_cache"][token_id] = price
-                app_state["ws_update_count"] += 1
-                # Live-update the event if mapped
-                event = _token_to_event.get(token_id)
-                if event:
-                    pm = event.markets.get(Platform.POLYMARKET)
-                    if pm and pm.price:
-                        # Preserve bid/ask from book fetch, only update midpoint
-                        pm.price.yes_price = price.yes_price
-                        pm.price.no_price = price.no_price
-                        pm.price.last_updated = price.last_updated
-                    elif pm:
-                        pm.price = price
-                # Check if subscription set changed — reconnect to pick up new tokens
-                if app_state["ws_subscribed_ids"] != _last_sub_snapshot:
-                    logger.info("WS subscription set changed, reconnecting...")
-                    break
+            async with asyncio.TaskGroup() as tg:
+                for shard in range(shards):
+                    tg.create_task(_ws_shard_listener(poly, shard, shards, pending))
         except Exception:
             logger.exception("WS price listener error, restarting...")
             await asyncio.sleep(5)
+        finally:
+            sync_task.cancel()
+            flush_task.cancel()
+
+
+def _shard_tokens(token_ids: set[str], shard: int, shards: int) -> set[str]:
+    """Tokens routed to one WS shard (a token stays on its shard for the process lifetime)."""
+    return {tid for tid in token_ids if hash(tid) % shards == shard}
+
+
+async def _ws_shard_listener(
+    poly: PolymarketConnector, shard: int, shards: int, pending: dict[str, MarketPrice],
+) -> None:
+    """Consume one WS shard's price stream into the WS cache and the pending flush."""
+    tokens = _shard_tokens(app_state.ws_subscribed_ids, shard, shards)
+    while not tokens:
+        # Nothing routed here yet; connect once this shard gets tokens
+        if not app_state.running:
+            return
+        await asyncio.sleep(2)
+        tokens = _shard_tokens(app_state.ws_subscribed_ids, shard, shards)
+    # No per-message running check: shutdown cancels this task directly
+    async for token_id, price in poly.subscribe_prices(list(tokens), shard=shard):
+        app_state.ws_price_cache[token_id] = price
+        app_state.ws_update_count += 1
+        pending[token_id] = price
+
+
+async def _flush_ws_prices(pending: dict[str, MarketPrice]) -> None:
+    """Apply coalesced WS ticks to their mapped events every WS_FLUSH_INTERVAL."""
+    while True:
+        await asyncio.sleep(WS_FLUSH_INTERVAL)
+        if not pending:
+            continue
+        updates = pending.copy()
+        pending.clear()
+        # Stamped like a CLOB fetch, so Pass 1 skips markets the WS keeps fresh
+        now = time.monotonic()
+        for token_id, price in updates.items():
+            event = _token_to_event.get(token_id)
+            if event:
+                pm = event.poly_market
+                if pm:
+                    _apply_ws_price(pm, price)
+                    pm.price_ts = now
+
+
+def _apply_ws_price(pm: Market, ws_price: MarketPrice) -> None:
+    """Store a WS price on a Polymarket market. WS prices are fresher than Gamma.
+
+    Updates the midpoint even if the market already has a price, keeping
+    bid/ask from any prior book fetch and volume from Gamma.
+    """
+    if pm.price and (pm.price.yes_bid is not None or pm.price.yes_ask is not None):
+        # Has book data — only update midpoint, keep bid/ask
+        pm.price.set_midpoint(ws_price)
+    else:
+        # No book data — use full WS price, preserve volume
+        vol = pm.price.volume if pm.price and pm.price.volume else 0
+        pm.price = ws_price
+        if vol:
+            pm.price.volume = vol
+
+
+async def _sync_ws_subscriptions(poly: PolymarketConnector, shards: int) -> None:
+    """Push subscription set changes to the open price WS shards as they happen."""
+    while True:
+        await _ws_subs_changed.wait()
+        _ws_subs_changed.clear()
+        subscribed = app_state.ws_subscribed_ids
+        for shard in range(shards):
+            try:
+                await poly.update_subscriptions(
+                    _shard_tokens(subscribed, shard, shards), shard=shard,
+                )
+            except Exception as e:
+                # A failed send means the socket is gone; subscribe_prices
+                # reconnects with the full, already-updated set
+                logger.debug("WS[%d] subscription update failed: %s", shard, e)
 
 
 def _update_ws_subscriptions(events: list[SportEvent]) -> None:
-    """Refresh WS subscription set and token→event mapping from matched events."""
+    """Refresh WS subscription set and token→event mapping from matched events.
+
+    Only called when the match cache is rebuilt. Every event is then a new
+    object, so the map is rebuilt whole; the WS is only told about changes
+    to the token set. Newly built events start from any WS price already
+    cached for their token; from then on the WS listener keeps them
+    updated directly.
+    """
     global _token_to_event
+    ws_cache = app_state.ws_price_cache
     new_map: dict[str, SportEvent] = {}
-    new_ids: set[str] = set()
     for event in events:
-        pm = event.markets.get(Platform.POLYMARKET)
+        pm = event.poly_market
         if not pm:
             continue
-        token_ids = pm.raw_data.get("clob_token_ids", [])
-        if token_ids:
-            tid = token_ids[0]
-            new_ids.add(tid)
+        tid = pm.primary_token_id
+        if tid:
             new_map[tid] = event
-    old_count = len(app_state["ws_subscribed_ids"])
+            ws_price = ws_cache.get(tid)
+            if ws_price is not None:
+                _apply_ws_price(pm, ws_price)
+    new_ids = set(new_map)
+    # Drop ticks for tokens no longer subscribed (including stragglers that
+    # arrived before the last unsubscribe) so the cache tracks the
+    # subscription set instead of every token ever seen
+    for tid in ws_cache.keys() - new_ids:
+        del ws_cache[tid]
+    old_ids = app_state.ws_subscribed_ids
     # Atomic swap: single assignment replaces the entire dict
     _token_to_event = new_map
-    app_state["ws_subscribed_ids"] = new_ids
-    if len(new_ids) != old_count:
-        logger.info(f"WS subscriptions updated: {old_count} → {len(new_ids)} tokens")
-
-
-def _apply_ws_cache(events: list[SportEvent]) -> int:
-    """Apply cached WS prices to events. WS prices are fresher than Gamma.
-
-    Updates midpoint even if event already has a price (overrides stale Gamma).
-    Preserves bid/ask from any prior book fetch.
-    """
-    ws_cache = app_state["ws_price_cache"]
-    if not ws_cache:
-        return 0
-    updated = 0
-    for event in events:
-        pm = event.markets.get(Platform.POLYMARKET)
-        if not pm:
-            continue
-        token_ids = pm.raw_data.get("clob_token_ids", [])
-        if not token_ids or token_ids[0] not in ws_cache:
-            continue
-        ws_price = ws_cache[token_ids[0]]
-        if pm.price and (pm.price.yes_bid is not None or pm.price.yes_ask is not None):
-            # Has book data — only update midpoint, keep bid/ask
-            pm.price.yes_price = ws_price.yes_price
-            pm.price.no_price = ws_price.no_price
-            pm.price.last_updated = ws_price.last_updated
-        else:
-            # No book data — use full WS price, preserve volume
-            vol = pm.price.volume if pm.price and pm.price.volume else 0
-            pm.price = ws_price
-            if vol:
-                pm.price.volume = vol
-        updated += 1
-    return updated
-
-
-def _get_event_sport(event: SportEvent) -> str:
-    """Extract sport from a SportEvent's markets."""
-    pm = event.markets.get(Platform.POLYMARKET)
-    km = event.markets.get(Platform.KALSHI)
-    return (pm.sport if pm else "") or (km.sport if km else "") or "other"
+    app_state.ws_subscribed_ids = new_ids
+    if new_ids != old_ids:
+        _ws_subs_changed.set()
+        logger.info(f"WS subscriptions updated: {len(old_ids)} → {len(new_ids)} tokens")
 
 
 async def _process_sport_group(
@@ -352,59 +459,62 @@ async def _process_sport_group(
     events: list[SportEvent],
     poly: PolymarketConnector,
     kalshi: KalshiConnector,
+    prices: asyncio.Task | None = None,
 ) -> tuple[list[tuple[SportEvent, ArbitrageOpportunity]], float]:
     """Process arb screening + book fetching + calculation for a sport group.
 
-    Returns (list of (event, opportunity) pairs, duration in seconds).
+    `events` are arb candidates (both platforms, game not in the past), as
+    selected by scan_loop. `prices` is the scan's midpoint fetch, awaited
+    first when some of the group's prices are being refreshed. Returns
+    (list of (event, opportunity) pairs, duration in seconds).
     """
+    if prices is not None:
+        await prices
     start = time.monotonic()
     results: list[tuple[SportEvent, ArbitrageOpportunity]] = []
 
     # Screen candidates by midpoint cost
     arb_candidates: list[SportEvent] = []
     for event in events:
-        if _is_stale_event(event):
-            continue
-        pm = event.markets.get(Platform.POLYMARKET)
-        km = event.markets.get(Platform.KALSHI)
+        pm = event.poly_market
+        km = event.kalshi_market
         if not (pm and km and pm.price and km.price):
             continue
         pp, kp = pm.price, km.price
-        if not _is_valid_price(pp) or not _is_valid_price(kp):
+        # Read each field once; the range/volume/cost checks are plain float
+        # math on locals, cheapest rejections first
+        p_yes, p_no, k_yes, k_no = pp.yes_price, pp.no_price, kp.yes_price, kp.no_price
+        if not (0.02 < k_yes < 0.98 and 0.02 < p_yes < 0.98):
             continue
-        if kp.yes_price <= 0.02 or kp.yes_price >= 0.98:
+        p_vol, k_vol = pp.volume or 0, kp.volume or 0
+        if not p_vol or not k_vol or p_vol + k_vol < 100:
             continue
-        if pp.yes_price <= 0.02 or pp.yes_price >= 0.98:
+        # Exactly 0.5/0.5 with no bid/ask = placeholder (even with volume);
+        # a 0.5/0.5 Poly price on a one-team market is never usable
+        if p_yes == 0.5 and p_no == 0.5 and (
+            not event.team_b or (pp.yes_bid is None and pp.yes_ask is None)
+        ):
             continue
-        if (pp.volume or 0) == 0 or (kp.volume or 0) == 0:
-            continue
-        combined_vol = (pp.volume or 0) + (kp.volume or 0)
-        if combined_vol < 100:
-            continue
-        if pp.yes_price == 0.5 and pp.no_price == 0.5 and not event.team_b:
+        if k_yes == 0.5 and k_no == 0.5 and kp.yes_bid is None and kp.yes_ask is None:
             continue
         if event.teams_swapped:
-            cost1 = pp.yes_price + (1 - kp.yes_price)
-            cost2 = kp.no_price + pp.no_price
+            cost = min(p_yes + 1 - k_yes, k_no + p_no)
         else:
-            cost1 = pp.yes_price + kp.no_price
-            cost2 = kp.yes_price + pp.no_price
-        if cost1 < 1.02 or cost2 < 1.02:
+            cost = min(p_yes + k_no, k_yes + p_no)
+        if cost < 1.02:
             arb_candidates.append(event)
 
     # Fetch order books for candidates
     if arb_candidates:
         await fetch_books_for_candidates(poly, kalshi, arb_candidates)
 
-    # Calculate arbitrage (only for non-stale events)
+    # Calculate arbitrage (stale events were filtered by scan_loop)
     # Second-chance pass: if arb found but no bid/ask, fetch books and recalculate
     needs_book: list[tuple[SportEvent, ArbitrageOpportunity]] = []
     for event in events:
-        if _is_stale_event(event):
-            continue
         opp = calculate_arbitrage(event)
         if opp:
-            pm = event.markets.get(Platform.POLYMARKET)
+            pm = event.poly_market
             has_bid_ask = pm and pm.price and pm.price.yes_bid is not None
             if has_bid_ask:
                 results.append((event, opp))
@@ -413,7 +523,7 @@ async def _process_sport_group(
 
     if needs_book:
         book_events = [ev for ev, _ in needs_book]
-        logger.info(f"Second-chance book fetch for {len(book_events)} arb events without bid/ask")
+        logger.info("Second-chance book fetch for %d arb events without bid/ask", len(book_events))
         await fetch_books_for_candidates(poly, kalshi, book_events)
         for event, midpoint_opp in needs_book:
             opp = calculate_arbitrage(event)
@@ -427,49 +537,173 @@ async def _process_sport_group(
     return results, duration
 
 
+def _has_game_today(events: list[SportEvent]) -> bool:
+    """True if any event's game is scheduled for today (prices move most then)."""
+    today = date.today()
+    for event in events:
+        for m in event.markets.values():
+            if m.game_date == today:
+                return True
+    return False
+
+
+def _record_match_churn(old_keys, new_keys) -> None:
+    """Fold the share of matched pairs that changed in a re-match into the churn EMA."""
+    if not old_keys:
+        return  # first build: nothing to compare against
+    union = len(old_keys | new_keys)
+    churn = len(old_keys ^ new_keys) / union if union else 0.0
+    app_state.match_churn_ema += CHURN_EMA_ALPHA * (churn - app_state.match_churn_ema)
+
+
+def _adaptive_ttl(base_ttl: float, churn: float, game_day: bool) -> float:
+    """Scale a cache TTL by how volatile the market set currently is."""
+    if game_day:
+        ttl = base_ttl / 2
+    elif churn < STABLE_CHURN:
+        ttl = base_ttl * 2
+    else:
+        ttl = base_ttl
+    ttl /= 1 + churn
+    return min(max(ttl, MIN_CACHE_TTL), MAX_CACHE_TTL)
+
+
+async def _refresh_market_caches(
+    poly: PolymarketConnector,
+    kalshi: KalshiConnector,
+    fetch_poly: bool,
+    fetch_kalshi: bool,
+) -> tuple[bool, bool]:
+    """Re-fetch market lists for the requested platforms and store them in app_state.
+
+    Returns (poly_fetched, kalshi_fetched).
+    """
+    now = time.monotonic()
+    targets: list[tuple[str, PolymarketConnector | KalshiConnector, float]] = []
+    if fetch_poly:
+        targets.append(("poly", poly, app_state.poly_cache_ttl_current))
+    if fetch_kalshi:
+        targets.append(("kalshi", kalshi, app_state.kalshi_cache_ttl_current))
+
+    results = await asyncio.gather(*(c.fetch_sports_events() for _, c, _ in targets))
+    for (key, _, ttl), markets in zip(targets, results):
+        setattr(app_state, f"{key}_cache", markets)
+        # Backdate by a random slice of the TTL so the caches don't keep co-expiring
+        setattr(app_state, f"{key}_cache_time", now - random.uniform(0, CACHE_TTL_JITTER * ttl))
+    return fetch_poly, fetch_kalshi
+
+
+async def _collect_market_prefetch(wait: bool = False) -> tuple[bool, bool]:
+    """Take the result of the background market-list refresh, if there is one.
+
+    A refresh still in flight keeps running unless wait is set. A failed
+    refresh is logged and counts as nothing fetched.
+    Returns (poly_fetched, kalshi_fetched).
+    """
+    global _market_prefetch
+    task = _market_prefetch
+    if task is None or not (wait or task.done()):
+        return False, False
+    _market_prefetch = None
+    try:
+        return await task
+    except Exception:
+        logger.exception("Market prefetch failed")
+        return False, False
+
+
+async def _load_market_lists(
+    poly: PolymarketConnector,
+    kalshi: KalshiConnector,
+    poly_ttl: float,
+    kalshi_ttl: float,
+) -> tuple[bool, bool]:
+    """Bring app_state's market lists up to date for a scan (stale-while-revalidate).
+
+    Expired lists are served as-is while a background refresh runs (see
+    _schedule_market_prefetch); only a missing list or one past
+    SWR_HARD_FACTOR x its TTL is fetched inline.
+    Returns (poly_new, kalshi_new): whether each list was replaced since the last scan.
+    """
+    prefetched_poly, prefetched_kalshi = await _collect_market_prefetch()
+
+    now = time.monotonic()
+    fetch_poly = (
+        not app_state.poly_cache or now - app_state.poly_cache_time >= poly_ttl * SWR_HARD_FACTOR
+    )
+    fetch_kalshi = (
+        not app_state.kalshi_cache or now - app_state.kalshi_cache_time >= kalshi_ttl * SWR_HARD_FACTOR
+    )
+    if (fetch_poly or fetch_kalshi) and _market_prefetch is not None:
+        # Hard miss with a refresh already in flight: wait for it
+        # instead of issuing the same fetch twice
+        prefetched_poly, prefetched_kalshi = await _collect_market_prefetch(wait=True)
+        fetch_poly = fetch_poly and not prefetched_poly
+        fetch_kalshi = fetch_kalshi and not prefetched_kalshi
+
+    await _refresh_market_caches(poly, kalshi, fetch_poly, fetch_kalshi)
+    # A prefetched list is new data too
+    return fetch_poly or prefetched_poly, fetch_kalshi or prefetched_kalshi
+
+
+def _schedule_market_prefetch(
+    poly: PolymarketConnector,
+    kalshi: KalshiConnector,
+    interval: float,
+    poly_ttl: float,
+    kalshi_ttl: float,
+) -> None:
+    """Start a background refresh of lists that expire before the next scan.
+
+    interval is the loop's current (possibly backed-off) scan interval. At
+    most one refresh runs at a time; the next scans keep using the current
+    lists until it lands.
+    """
+    global _market_prefetch
+    if _market_prefetch is not None:
+        return
+    next_scan = time.monotonic() + interval
+    prefetch_poly = next_scan - app_state.poly_cache_time >= poly_ttl
+    prefetch_kalshi = next_scan - app_state.kalshi_cache_time >= kalshi_ttl
+    if prefetch_poly or prefetch_kalshi:
+        _market_prefetch = asyncio.create_task(
+            _refresh_market_caches(poly, kalshi, prefetch_poly, prefetch_kalshi)
+        )
+
+
 async def scan_loop(poly: PolymarketConnector, kalshi: KalshiConnector) -> None:
     """Main scanning loop: fetch events, match, check arbitrage."""
+    global _market_prefetch
     _scan_count = 0
-    while app_state["running"]:
+    # Effective scan interval: widened while scans keep overrunning poll_interval
+    interval = float(settings.poll_interval)
+    overrun_streak = 0
+    while app_state.running:
+        scan_start = time.monotonic()
         try:
-            scan_start = time.monotonic()
             logger.info("--- Scanning for events ---")
 
-            now = time.monotonic()
+            stale_keys: list[tuple[str, str, str]] = []
 
-            # Caching: reuse Kalshi markets if cache is fresh
-            kalshi_cache_age = now - app_state["kalshi_cache_time"]
-            poly_cache_age = now - app_state["poly_cache_time"]
+            now = time.monotonic()
 
-            fetch_poly = poly_cache_age >= POLY_CACHE_TTL or not app_state["poly_cache"]
-            fetch_kalshi = kalshi_cache_age >= KALSHI_CACHE_TTL or not app_state["kalshi_cache"]
+            # Cache TTLs adapt to match churn and whether games are on today
+            game_day = _has_game_today(app_state.matched_events)
+            churn = app_state.match_churn_ema
+            poly_ttl = _adaptive_ttl(POLY_CACHE_TTL, churn, game_day)
+            kalshi_ttl = _adaptive_ttl(KALSHI_CACHE_TTL, churn, game_day)
+            app_state.poly_cache_ttl_current = poly_ttl
+            app_state.kalshi_cache_ttl_current = kalshi_ttl
 
-            if fetch_poly and fetch_kalshi:
-                poly_markets, kalshi_markets = await asyncio.gather(
-                    poly.fetch_sports_events(),
-                    kalshi.fetch_sports_events(),
-                )
-                app_state["poly_cache"] = poly_markets
-                app_state["poly_cache_time"] = now
-                app_state["kalshi_cache"] = kalshi_markets
-                app_state["kalshi_cache_time"] = now
-            elif fetch_poly:
-                poly_markets = await poly.fetch_sports_events()
-                app_state["poly_cache"] = poly_markets
-                app_state["poly_cache_time"] = now
-                kalshi_markets = app_state["kalshi_cache"]
-            elif fetch_kalshi:
-                kalshi_markets = await kalshi.fetch_sports_events()
-                app_state["kalshi_cache"] = kalshi_markets
-                app_state["kalshi_cache_time"] = now
-                poly_markets = app_state["poly_cache"]
-            else:
-                poly_markets = app_state["poly_cache"]
-                kalshi_markets = app_state["kalshi_cache"]
+            # Caching: expired lists are refreshed in the background (see the
+            # prefetch below); only a missing or badly stale list is fetched inline
+            fetch_poly, fetch_kalshi = await _load_market_lists(poly, kalshi, poly_ttl, kalshi_ttl)
+            poly_markets = app_state.poly_cache
+            kalshi_markets = app_state.kalshi_cache
 
             # Update metrics
-            app_state["poly_count"] = len(poly_markets)
-            app_state["kalshi_count"] = len(kalshi_markets)
+            app_state.poly_count = len(poly_markets)
+            app_state.kalshi_count = len(kalshi_markets)
 
             logger.info(
                 f"Fetched {len(poly_markets)} Polymarket, {len(kalshi_markets)} Kalshi markets"
@@ -477,72 +711,102 @@ async def scan_loop(poly: PolymarketConnector, kalshi: KalshiConnector) -> None:
                 f"kalshi={'HIT' if not fetch_kalshi else 'MISS'})"
             )
 
-            # Match events across platforms (with caching)
-            match_cache_age = now - app_state["matched_events_cache_time"]
+            # Match events across platforms (with caching). Matches are reused
+            # for as long as both market lists are the same objects they were
+            # built from; prices still flow through the shared Market objects.
+            match_cache_age = now - app_state.matched_events_cache_time
+            cached_poly, cached_kalshi = app_state.matched_events_cache_inputs
             use_match_cache = (
-                match_cache_age < MATCH_CACHE_TTL
-                and app_state["matched_events_cache"]
-                and not fetch_poly
-                and not fetch_kalshi
+                app_state.matched_events_cache
+                and cached_poly is poly_markets
+                and cached_kalshi is kalshi_markets
             )
 
             if use_match_cache:
                 # Reuse cached matches - much faster than re-running matcher
-                matched = list(app_state["matched_events_cache"].values())
+                matched = list(app_state.matched_events_cache.values())
                 logger.info(f"Using cached matches ({len(matched)} events, {match_cache_age:.0f}s old)")
             else:
                 # Full re-match required
                 matched = match_events(poly_markets, kalshi_markets)
+                old_match_keys = app_state.matched_events_cache.keys()
                 # Build cache: (poly_id, kalshi_id) -> SportEvent
-                app_state["matched_events_cache"] = {
+                app_state.matched_events_cache = {
                     (
-                        e.markets.get(Platform.POLYMARKET).market_id if e.markets.get(Platform.POLYMARKET) else "",
-                        e.markets.get(Platform.KALSHI).market_id if e.markets.get(Platform.KALSHI) else "",
+                        e.poly_market.market_id if e.poly_market else "",
+                        e.kalshi_market.market_id if e.kalshi_market else "",
                     ): e
                     for e in matched
                     if e.matched
                 }
-                app_state["matched_events_cache_time"] = now
-                logger.info(f"Rebuilt match cache ({len(matched)} events)")
+                app_state.matched_events_cache_time = now
+                app_state.matched_events_cache_inputs = (poly_markets, kalshi_markets)
+                _record_match_churn(old_match_keys, app_state.matched_events_cache.keys())
+                logger.info(
+                    f"Rebuilt match cache ({len(matched)} events, "
+                    f"churn EMA {app_state.match_churn_ema:.2f}, "
+                    f"TTL poly={poly_ttl:.0f}s kalshi={kalshi_ttl:.0f}s)"
+                )
+                # New events: remap WS tokens and seed prices from the WS
+                # cache (cached matches are already mapped and kept live)
+                _update_ws_subscriptions(matched)
 
-            app_state["matched_events"] = matched
+            app_state.matched_events = matched
 
-            # Update WS subscriptions with current matched token_ids
-            _update_ws_subscriptions(matched)
+            # Pipeline: if a market cache has expired or will before the next
+            # scan, refresh it in the background
+            _schedule_market_prefetch(poly, kalshi, interval, poly_ttl, kalshi_ttl)
 
-            # Log Kalshi-only games for well-known soccer leagues (debug level)
-            _major_soccer_leagues = {"soccer"}
-            for event in matched:
-                if not event.matched:
-                    km = event.markets.get(Platform.KALSHI)
-                    if km and km.sport in _major_soccer_leagues and event.team_b:
-                        logger.debug(
-                            f"Kalshi-only: {event.team_a} vs {event.team_b} ({km.sport}) "
-                            f"— no Poly match found"
-                        )
+            # Log Kalshi-only games for well-known soccer leagues (debug level;
+            # the scan over all events is skipped unless debug logging is on)
+            if logger.isEnabledFor(logging.DEBUG):
+                _major_soccer_leagues = {"soccer"}
+                for event in matched:
+                    if not event.matched:
+                        km = event.kalshi_market
+                        if km and km.sport in _major_soccer_leagues and event.team_b:
+                            logger.debug(
+                                "Kalshi-only: %s vs %s (%s) — no Poly match found",
+                                event.team_a, event.team_b, km.sport,
+                            )
 
             if matched:
-                # Pass 0.5: Apply any cached WS prices before full fetch
-                ws_applied = _apply_ws_cache(matched)
-                if ws_applied:
-                    logger.info(f"WS cache: applied {ws_applied} cached prices")
-
-                # Pass 1: Fetch midpoint prices for all matched events
-                await fetch_and_update_prices(poly, kalshi, matched)
-
-                # Group events by sport for parallel processing
+                # One pass over matched: keep events that can produce an arb
+                # and group them by sport for parallel processing. One-sided
+                # and past events are neither priced nor screened.
+                price_events: list[SportEvent] = []
                 sport_groups: dict[str, list[SportEvent]] = defaultdict(list)
+                today = date.today()
                 for event in matched:
-                    sport_groups[_get_event_sport(event)].append(event)
+                    if _is_arb_candidate(event, today):
+                        price_events.append(event)
+                        sport_groups[event.sport or "other"].append(event)
+                skipped = len(matched) - len(price_events)
+                if skipped:
+                    logger.info(f"Price fetch: skipping {skipped} one-sided/past events")
+
+                # Pass 1: Fetch midpoint prices for the candidates
+                prices_task = asyncio.create_task(
+                    fetch_and_update_prices(poly, kalshi, price_events)
+                )
 
-                # Pass 2+3: Process each sport group in parallel
+                # Pass 2+3: Process each sport group in parallel. Groups whose
+                # prices are all still fresh go straight to screening and book
+                # fetches, overlapping Pass 1; the rest wait for its prices.
+                fresh_after = _price_fresh_after()
                 sport_tasks = {
-                    sport: _process_sport_group(sport, events, poly, kalshi)
+                    sport: _process_sport_group(
+                        sport, events, poly, kalshi,
+                        prices=None if all(
+                            _has_fresh_price(e.poly_market, fresh_after) for e in events
+                        ) else prices_task,
+                    )
                     for sport, events in sport_groups.items()
                 }
                 sport_results = await asyncio.gather(
                     *sport_tasks.values(), return_exceptions=True,
                 )
+                await prices_task  # a Pass 1 failure still fails the scan
 
                 # Pass 4: 3-Way arbitrage for soccer (separate pass using raw markets)
                 threeway_results: list[ArbitrageOpportunity] = []
@@ -561,6 +825,18 @@ async def scan_loop(poly: PolymarketConnector, kalshi: KalshiConnector) -> None:
                 current_arb_keys: set[tuple[str, str, str]] = set()
                 seen_game_keys: set[tuple[str, ...]] = set()
                 sport_timings: dict[str, float] = {}
+                # In-memory index of active arbs (loaded at startup, kept in
+                # sync by the save/deactivate calls below and reloaded from
+                # the DB if they fail) instead of a query
+                active_keys = app_state.active_opps
+                # All DB writes for this scan, persisted in one batch: (opp, sport)
+                pending_saves: list[tuple[ArbitrageOpportunity, str]] = []
+                new_arbs: list[ArbitrageOpportunity] = []
+                new_3way_arbs: list[ArbitrageOpportunity] = []
+                new_arb_items: list[dict] = []  # SSE payloads for new_arbs + new_3way_arbs
+                # ROI bounds read once per scan, not per opportunity
+                min_arb = settings.min_arb_percent
+                max_arb = settings.max_arb_percent
 
                 for sport_name, result in zip(sport_tasks.keys(), sport_results):
                     if isinstance(result, Exception):
@@ -573,90 +849,43 @@ async def scan_loop(poly: PolymarketConnector, kalshi: KalshiConnector) -> None:
                     for event, opp in arb_results:
                         # Update existing active opportunities with new ROI (even if dropped)
                         # This ensures dashboard shows current ROI, not stale values
-                        arb_key = (
-                            opp.team_a,
-                            opp.platform_buy_yes.value,
-                            opp.platform_buy_no.value,
-                        )
-                        existing = await db.find_active_by_key(*arb_key)
-                        if existing and opp.roi_after_fees < settings.min_arb_percent:
+                        arb_key = opp.arb_key
+                        _sport = event.sport
+                        if arb_key in active_keys and opp.roi_after_fees < min_arb:
                             # ROI dropped below threshold — update DB with real ROI before deactivating
-                            _pm = event.markets.get(Platform.POLYMARKET)
-                            _km = event.markets.get(Platform.KALSHI)
-                            _sport = (_pm.sport if _pm else "") or (_km.sport if _km else "")
-                            await db.save_opportunity(opp, sport=_sport)
+                            pending_saves.append((opp, _sport))
                             logger.info(
                                 f"ROI DROPPED: {opp.event_title} now {opp.roi_after_fees:.2f}% "
-                                f"(below {settings.min_arb_percent}% threshold)"
+                                f"(below {min_arb}% threshold)"
                             )
                             # Don't add to current_arb_keys — will be deactivated
                             continue
 
-                        if not (opp.roi_after_fees >= settings.min_arb_percent):
+                        if not (opp.roi_after_fees >= min_arb):
                             continue
-                        if opp.roi_after_fees > settings.max_arb_percent:
+                        if opp.roi_after_fees > max_arb:
                             logger.warning(
-                                f"SUSPICIOUS ARB (skipped, ROI>{settings.max_arb_percent}%): "
+                                f"SUSPICIOUS ARB (skipped, ROI>{max_arb}%): "
                                 f"{opp.event_title} ROI={opp.roi_after_fees}%"
                             )
                             continue
 
-                        game_key = tuple(sorted([
-                            opp.team_a.lower().strip(),
-                            opp.team_b.lower().strip(),
-                        ]))
+                        # Opps carry their event's teams; the key is cached on the event
+                        game_key = event.game_key
                         if game_key in seen_game_keys:
                             continue
                         seen_game_keys.add(game_key)
 
                         # arb_key already computed above
                         current_arb_keys.add(arb_key)
-
-                        _pm = event.markets.get(Platform.POLYMARKET)
-                        _km = event.markets.get(Platform.KALSHI)
-                        _sport = (_pm.sport if _pm else "") or (_km.sport if _km else "")
-                        opp_id = await db.save_opportunity(opp, sport=_sport)
-
-                        # Diagnostic: Log spread/O-U and other special market types
-                        _subtype = opp.details.get("market_subtype", "moneyline")
-                        _line = opp.details.get("line")
-                        _arb_type = opp.details.get("arb_type", "yes_no")
-                        _is_live = opp.details.get("is_live", False)
-
-                        type_info = ""
-                        if _subtype == "spread":
-                            type_info = f" [SPREAD {_line}]"
-                        elif _subtype == "over_under":
-                            type_info = f" [O/U {abs(_line) if _line else ''}]"
-                        if _arb_type == "cross_team":
-                            type_info += " [CROSS-TEAM]"
-                        if _is_live:
-                            type_info += " [LIVE]"
-
-                        logger.info(
-                            f"ARBITRAGE SAVED: {opp.event_title} "
-                            f"ROI={opp.roi_after_fees}% id={opp_id}{type_info}"
-                        )
-                        broadcast_event("new_arb", {
-                            "event": opp.event_title,
-                            "roi": opp.roi_after_fees,
-                            "cost": opp.total_cost,
-                        })
-
-                        # Try to execute if executor is enabled
-                        if _executor is not None and opp.roi_after_fees >= settings.executor_min_roi:
-                            try:
-                                result = await _executor.try_execute(opp)
-                                if result:
-                                    logger.info(f"EXECUTOR: {opp.event_title} -> {result.status.value}")
-                            except Exception as e:
-                                logger.error(f"Executor error for {opp.event_title}: {e}")
+                        pending_saves.append((opp, _sport))
+                        new_arbs.append(opp)
 
                 # Process 3-way arbitrage results
                 for opp in threeway_results:
-                    if not (opp.roi_after_fees >= settings.min_arb_percent):
+                    if not (opp.roi_after_fees >= min_arb):
                         continue
-                    if opp.roi_after_fees > settings.max_arb_percent:
+                    if opp.roi_after_fees > max_arb:
                         logger.warning(
                             f"SUSPICIOUS 3-WAY ARB (skipped): {opp.event_title} ROI={opp.roi_after_fees}%"
                         )
@@ -670,53 +899,92 @@ async def scan_loop(poly: PolymarketConnector, kalshi: KalshiConnector) -> None:
                         continue
                     seen_game_keys.add(game_key)
 
-                    arb_key = (
-                        opp.team_a,
-                        opp.platform_buy_yes.value,
-                        opp.platform_buy_no.value,  # Match DB key format
+                    current_arb_keys.add(opp.arb_key)
+                    pending_saves.append((opp, "soccer"))
+                    new_3way_arbs.append(opp)
+
+                # Persist every opportunity from this scan in one batch
+                await db.save_opportunities(pending_saves, active=active_keys)
+
+                for opp in new_arbs:
+                    # Diagnostic: Log spread/O-U and other special market types
+                    _subtype = opp.details.get("market_subtype", "moneyline")
+                    _line = opp.details.get("line")
+                    _arb_type = opp.details.get("arb_type", "yes_no")
+                    _is_live = opp.details.get("is_live", False)
+
+                    type_info = ""
+                    if _subtype == "spread":
+                        type_info = f" [SPREAD {_line}]"
+                    elif _subtype == "over_under":
+                        type_info = f" [O/U {abs(_line) if _line else ''}]"
+                    if _arb_type == "cross_team":
+                        type_info += " [CROSS-TEAM]"
+                    if _is_live:
+                        type_info += " [LIVE]"
+
+                    logger.info(
+                        f"ARBITRAGE SAVED: {opp.event_title} "
+                        f"ROI={opp.roi_after_fees}% id={opp.id}{type_info}"
                     )
-                    current_arb_keys.add(arb_key)
+                    new_arb_items.append({
+                        "event": opp.event_title,
+                        "roi": opp.roi_after_fees,
+                        "cost": opp.total_cost,
+                    })
 
-                    opp_id = await db.save_opportunity(opp, sport="soccer")
+                for opp in new_3way_arbs:
                     logger.info(
                         f"3-WAY ARBITRAGE SAVED: {opp.event_title} "
-                        f"ROI={opp.roi_after_fees}% id={opp_id} [3-WAY]"
+                        f"ROI={opp.roi_after_fees}% id={opp.id} [3-WAY]"
                     )
-                    broadcast_event("new_arb", {
+                    new_arb_items.append({
                         "event": opp.event_title,
                         "roi": opp.roi_after_fees,
                         "cost": opp.total_cost,
                         "type": "3way",
                     })
 
+                # One SSE message for all new arbs (one dashboard refresh)
+                if new_arb_items:
+                    broadcast_event("new_arbs", {"items": new_arb_items})
+
+                # Try to execute if executor is enabled
+                if _executor is not None:
+                    for opp in new_arbs:
+                        if opp.roi_after_fees < settings.executor_min_roi:
+                            continue
+                        try:
+                            result = await _executor.try_execute(opp)
+                            if result:
+                                logger.info(f"EXECUTOR: {opp.event_title} -> {result.status.value}")
+                        except Exception as e:
+                            logger.error(f"Executor error for {opp.event_title}: {e}")
+
                 # Log per-sport timing
-                app_state["scan_metrics_by_sport"] = sport_timings
+                app_state.scan_metrics_by_sport = sport_timings
                 if sport_timings:
                     timing_str = ", ".join(f"{s}={t}s" for s, t in sorted(sport_timings.items()))
                     logger.info(f"Sport workers: {timing_str}")
 
-                # Save ROI snapshots for all active arbs
-                active_opps = await db.get_active_opportunities(limit=200)
-                for active_opp in active_opps:
-                    await db.save_roi_snapshot(
-                        active_opp["id"], active_opp.get("roi_after_fees", 0)
-                    )
+                # Save ROI snapshots for all active arbs (one statement)
+                await db.snapshot_active_roi(limit=200)
 
-                # Deactivate stale opportunities not found this scan
-                active_keys = await db.get_active_opp_keys()
-                for key, opp_id in active_keys.items():
-                    if key not in current_arb_keys:
-                        n = await db.deactivate_by_key(*key)
-                        logger.info(f"Deactivated stale arbs: {n} entries for key={key}")
+                # Deactivate stale opportunities not found this scan (same
+                # transaction as the saves above, committed once below)
+                stale_keys = list(active_keys.keys() - current_arb_keys)
+                if stale_keys:
+                    n = await db.deactivate_by_keys(stale_keys)
+                    logger.info(f"Deactivated stale arbs: {n} entries for {len(stale_keys)} keys")
 
                 broadcast_event("price_update", {
                     "matched_count": len(matched),
                 })
 
             # Polymarket tag discovery — run once per hour
-            tag_discovery_age = time.monotonic() - app_state["last_tag_discovery"]
+            tag_discovery_age = time.monotonic() - app_state.last_tag_discovery
             if tag_discovery_age >= 3600:  # 60 minutes
-                app_state["last_tag_discovery"] = time.monotonic()
+                app_state.last_tag_discovery = time.monotonic()
                 try:
                     new_tags = await poly.discover_sports_tags()
                     if new_tags:
@@ -727,8 +995,11 @@ async def scan_loop(poly: PolymarketConnector, kalshi: KalshiConnector) -> None:
                 except Exception:
                     logger.exception("Tag discovery failed")
 
-            # Batch commit all DB writes from this scan cycle
+            # Batch commit all DB writes from this scan cycle; deactivated
+            # keys leave the index only once that has gone through
             await db.commit()
+            for key in stale_keys:
+                app_state.active_opps.pop(key, None)
 
             # Periodic cleanup: delete old inactive opportunities every 100 scans
             _scan_count += 1
@@ -742,21 +1013,67 @@ async def scan_loop(poly: PolymarketConnector, kalshi: KalshiConnector) -> None:
                 await db.commit()
 
             scan_duration = time.monotonic() - scan_start
-            app_state["last_scan_duration"] = round(scan_duration, 1)
-            logger.info(f"Scan completed in {scan_duration:.1f}s")
+            app_state.last_scan_duration = round(scan_duration, 1)
+            limiter_stats = {
+                "poly": _poly_limiter.stats(),
+                "poly_book": _poly_book_limiter.stats(),
+                "kalshi": kalshi.rate_limiter.stats(),
+            }
+            # Requests each limiter held back during this scan (counters are cumulative)
+            throttled = ", ".join(
+                f"{name}={n}"
+                for name, stats in limiter_stats.items()
+                if (n := stats["throttled"] - app_state.rate_limit_stats.get(name, {}).get("throttled", 0))
+            )
+            app_state.rate_limit_stats = limiter_stats
+            logger.info(
+                f"Scan completed in {scan_duration:.1f}s"
+                + (f" (rate-limited: {throttled})" if throttled else "")
+            )
 
+        except asyncio.CancelledError:
+            break  # shutdown signal
         except Exception:
             logger.exception("Error in scan loop")
+            # A failed save/deactivate/commit leaves the active-arb index out
+            # of step with the DB; rebuild it from the rows themselves
+            try:
+                app_state.active_opps = await db.get_active_opp_keys()
+            except Exception:
+                logger.exception("Reloading active arb index failed")
+
+        # Keep a steady cadence: sleep only for what is left of the interval
+        elapsed = time.monotonic() - scan_start
+        if elapsed > interval * SCAN_OVERRUN_FACTOR:
+            overrun_streak += 1
+            if overrun_streak >= 3 and interval < settings.poll_interval * MAX_INTERVAL_BACKOFF:
+                interval = min(interval * 2, settings.poll_interval * MAX_INTERVAL_BACKOFF)
+                overrun_streak = 0
+                logger.warning(
+                    f"Scans keep overrunning ({elapsed:.1f}s), widening interval to {interval:.0f}s"
+                )
+        else:
+            overrun_streak = 0
+            if interval > settings.poll_interval and elapsed < settings.poll_interval:
+                interval = float(settings.poll_interval)
+                logger.info(f"Scan time back under poll interval, interval reset to {interval:.0f}s")
+
+        try:
+            await asyncio.sleep(max(0.0, interval - elapsed))
+        except asyncio.CancelledError:
+            break  # shutdown signal, don't wait out the poll interval
 
-        await asyncio.sleep(settings.poll_interval)
+    if _market_prefetch is not None:
+        _market_prefetch.cancel()
+        _market_prefetch = None
 
 
 async def kalshi_price_poller(kalshi: KalshiConnector) -> None:
     """Background task: poll fresh Kalshi prices for markets in active arbs."""
-    while app_state["running"]:
+    while app_state.running:
         try:
             await asyncio.sleep(30)  # Poll every 30 seconds
-            if not app_state["running"]:
+            if not app_state.running:
                 break
 
             # Get active opportunities to find Kalshi market IDs
@@ -766,14 +1083,14 @@ async def kalshi_price_poller(kalshi: KalshiConnector) -> None:
 
             # Collect Kalshi market IDs from matched events that have active arbs
             arb_teams = {opp.get("team_a", "") for opp in active_opps}
-            matched = app_state.get("matched_events", [])
+            matched = app_state.matched_events
             kalshi_ids: list[str] = []
             kalshi_event_map: dict[str, SportEvent] = {}
 
             for event in matched:
                 if event.team_a not in arb_teams:
                     continue
-                km = event.markets.get(Platform.KALSHI)
+                km = event.kalshi_market
                 if km:
                     kalshi_ids.append(km.market_id)
                     kalshi_event_map[km.market_id] = event
@@ -787,7 +1104,7 @@ async def kalshi_price_poller(kalshi: KalshiConnector) -> None:
             for mid, price in fresh_prices.items():
                 event = kalshi_event_map.get(mid)
                 if event:
-                    km = event.markets.get(Platform.KALSHI)
+                    km = event.kalshi_market
                     if km:
                         km.price = price
                         updated += 1
@@ -831,6 +1148,7 @@ async def run_app() -> None:
     purged = await db.deactivate_all_active()
     if purged:
         logger.info(f"Startup: deactivated {purged} stale arbs from previous run")
+    app_state.active_opps = await db.get_active_opp_keys()
 
     # Init connectors
     poly = PolymarketConnector()
@@ -839,14 +1157,14 @@ async def run_app() -> None:
     await kalshi.connect()
 
     # Store connectors in app_state for dashboard access
-    app_state["poly_connector"] = poly
-    app_state["kalshi_connector"] = kalshi
+    app_state.poly_connector = poly
+    app_state.kalshi_connector = kalshi
 
     # Init executor settings manager
     from src.executor import ExecutorSettingsManager, ExecutorWSHandler, TradeLogger
     settings_manager = ExecutorSettingsManager(db)
     await settings_manager.load()
-    app_state["executor_settings_manager"] = settings_manager
+    app_state.executor_settings_manager = settings_manager
 
     # Init WebSocket handler for executor dashboard
     ws_handler = ExecutorWSHandler(
@@ -855,11 +1173,11 @@ async def run_app() -> None:
         poly_connector=poly,
         kalshi_connector=kalshi,
     )
-    app_state["executor_ws_handler"] = ws_handler
+    app_state.executor_ws_handler = ws_handler
 
     # Init trade logger
     trade_logger = TradeLogger(db=db, ws_handler=ws_handler)
-    app_state["trade_logger"] = trade_logger
+    app_state.trade_logger = trade_logger
 
     # Init executor if enabled
     global _executor
@@ -886,7 +1204,9 @@ async def run_app() -> None:
             await position_manager.connect()
             telegram = TelegramNotifier(
                 settings.telegram_bot_token,
-                settings.telegram_chat_id
+                settings.telegram_chat_id,
+                webhook_url=settings.telegram_webhook_url,
+                webhook_secret=settings.telegram_webhook_secret,
             )
             _executor = Executor(
                 risk_manager=risk_manager,
@@ -912,7 +1232,7 @@ async def run_app() -> None:
             settings_manager.subscribe(on_settings_changed)
 
             # Store executor in app_state for dashboard access
-            app_state["executor"] = _executor
+            app_state.executor = _executor
 
             logger.info("Executor initialized and ENABLED")
         except Exception as e:
@@ -923,9 +1243,11 @@ async def run_app() -> None:
 
     # Setup web routes (deferred to avoid circular import)
     from src.web.app import setup_routes
-    from src.web.routes import set_executor_ws_handler
+    from src.web.routes import set_executor_ws_handler, set_telegram_notifier
     setup_routes()
     set_executor_ws_handler(ws_handler)
+    if _executor is not None:
+        set_telegram_notifier(_executor.telegram)
 
     # Start web server
     config = uvicorn.Config(
@@ -936,23 +1258,40 @@ async def run_app() -> None:
     )
     server = uvicorn.Server(config)
 
-    # Handle shutdown
-    def shutdown_handler(sig, frame):
+    # Web server in the foreground, background loops as tasks we can cancel
+    background = [
+        asyncio.create_task(scan_loop(poly, kalshi)),
+        asyncio.create_task(ws_price_listener(poly)),
+        asyncio.create_task(kalshi_price_poller(kalshi)),
+    ]
+
+    # Handle shutdown: stop the server and cancel the background loops directly,
+    # so nothing sleeps out poll_interval or waits on an idle WS stream
+    def shutdown_handler():
         logger.info("Shutdown signal received")
-        app_state["running"] = False
+        app_state.running = False
+        server.should_exit = True
+        for task in background:
+            task.cancel()
 
-    signal.signal(signal.SIGINT, shutdown_handler)
-    signal.signal(signal.SIGTERM, shutdown_handler)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, shutdown_handler)
+        except NotImplementedError:  # Windows event loop
+            signal.signal(sig, lambda _sig, _frame: loop.call_soon_threadsafe(shutdown_handler))
 
-    # Run web server, scan loop, WS price listener, and Kalshi poller concurrently
+    # uvicorn captures SIGINT/SIGTERM itself while serving and returns from
+    # serve() on them; whichever way the server stops, the loops stop with it
     try:
-        await asyncio.gather(
-            server.serve(),
-            scan_loop(poly, kalshi),
-            ws_price_listener(poly),
-            kalshi_price_poller(kalshi),
-        )
+        await server.serve()
     finally:
+        app_state.running = False
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        # Bounded: a dead DB must not block shutdown (unsaved trades are in the log)
+        await trade_logger.flush(timeout=10)
         await poly.disconnect()
         await kalshi.disconnect()
         await db.close()
@@ -960,7 +1299,13 @@ async def run_app() -> None:
 
 
 def main():
-    asyncio.run(run_app())
+    try:
+        import uvloop
+    except ImportError:  # optional speedup (not available on Windows)
+        asyncio.run(run_app())
+        return
+    logger.info("Using uvloop event loop")
+    asyncio.run(run_app(), loop_factory=uvloop.new_event_loop)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import UTC, date, datetime
 from enum import Enum
+from functools import cached_property
 
 from pydantic import BaseModel, Field
 
@@ -130,6 +131,12 @@ class MarketPrice(BaseModel):
     yes_depth: OrderBookDepth | None = None
     no_depth: OrderBookDepth | None = None
 
+    def set_midpoint(self, other: MarketPrice) -> None:
+        """Copy midpoint prices and timestamp from another price, keeping bid/ask."""
+        self.yes_price = other.yes_price
+        self.no_price = other.no_price
+        self.last_updated = other.last_updated
+
 
 class Market(BaseModel):
     platform: Platform
@@ -147,8 +154,20 @@ class Market(BaseModel):
     map_number: int | None = None  # esports map number (1, 2, 3, etc.)
     url: str = ""
     price: MarketPrice | None = None
+    price_ts: float | None = None  # monotonic time price was last refreshed (CLOB fetch or WS tick)
     raw_data: dict = Field(default_factory=dict)
 
+    @cached_property
+    def primary_token_id(self) -> str | None:
+        """First CLOB token id (Polymarket); keys price, book and WS lookups."""
+        tokens = self.raw_data.get("clob_token_ids")
+        return tokens[0] if tokens else None
+
+    @cached_property
+    def neg_risk(self) -> bool:
+        """Polymarket negRisk (multi-outcome) market."""
+        return bool(self.raw_data.get("neg_risk", False))
+
 
 class SportEvent(BaseModel):
     id: str = ""
@@ -161,6 +180,33 @@ class SportEvent(BaseModel):
     matched: bool = False
     teams_swapped: bool = False  # True = Poly team_a corresponds to Kalshi team_b
 
+    @cached_property
+    def poly_market(self) -> Market | None:
+        """Polymarket leg; markets is fixed once the matcher builds the event."""
+        return self.markets.get(Platform.POLYMARKET)
+
+    @cached_property
+    def kalshi_market(self) -> Market | None:
+        """Kalshi leg; markets is fixed once the matcher builds the event."""
+        return self.markets.get(Platform.KALSHI)
+
+    @cached_property
+    def sport(self) -> str:
+        """Sport of the Polymarket leg, else the Kalshi leg ("" if neither has one)."""
+        pm, km = self.poly_market, self.kalshi_market
+        return (pm.sport if pm else "") or (km.sport if km else "")
+
+    @cached_property
+    def game_key(self) -> tuple[str, ...]:
+        """Order-independent normalized team pair; dedups arbs on the same game."""
+        return tuple(sorted([self.team_a.lower().strip(), self.team_b.lower().strip()]))
+
+    @cached_property
+    def game_date(self) -> date | None:
+        """Latest game_date across this event's markets (None if none has one)."""
+        dates = [m.game_date for m in self.markets.values() if m.game_date]
+        return max(dates) if dates else None
+
 
 class ThreeWayGroup(BaseModel):
     """Group of 3-way markets (Win A, Draw, Win B) for a soccer match."""
@@ -192,3 +238,8 @@ class ArbitrageOpportunity(BaseModel):
     found_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     still_active: bool = True
     details: dict = Field(default_factory=dict)
+
+    @cached_property
+    def arb_key(self) -> tuple[str, str, str]:
+        """(team_a, platform_buy_yes, platform_buy_no) — the DB dedup key for active arbs."""
+        return (self.team_a, self.platform_buy_yes.value, self.platform_buy_no.value)
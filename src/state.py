@@ -1,32 +1,55 @@
 """Shared application state accessible by all modules."""
 
-app_state: dict = {
-    "matched_events": [],
-    "running": True,
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class AppState:
+    """Process-wide state written by the scan loop and read by the web routes.
+
+    Slotted so every attribute is declared up front and typos fail loudly.
+    """
+
+    matched_events: list = field(default_factory=list)
+    running: bool = True
     # Market caches
-    "kalshi_cache": [],
-    "kalshi_cache_time": 0.0,
-    "poly_cache": [],
-    "poly_cache_time": 0.0,
+    kalshi_cache: list = field(default_factory=list)
+    kalshi_cache_time: float = 0.0
+    poly_cache: list = field(default_factory=list)
+    poly_cache_time: float = 0.0
+    # Adaptive cache TTLs in effect for the current scan (0 until the first scan)
+    poly_cache_ttl_current: float = 0.0
+    kalshi_cache_ttl_current: float = 0.0
+    match_churn_ema: float = 0.0  # smoothed fraction of matched pairs changed per re-match
     # Metrics
-    "poly_count": 0,
-    "kalshi_count": 0,
-    "last_scan_duration": 0.0,
+    poly_count: int = 0
+    kalshi_count: int = 0
+    last_scan_duration: float = 0.0
     # WebSocket price streaming
-    "ws_price_cache": {},        # token_id -> MarketPrice
-    "ws_subscribed_ids": set(),  # currently subscribed token_ids
-    "ws_update_count": 0,        # total WS price updates received
+    ws_price_cache: dict = field(default_factory=dict)   # token_id -> MarketPrice (subscribed tokens)
+    ws_subscribed_ids: set = field(default_factory=set)  # currently subscribed token_ids
+    ws_update_count: int = 0                              # total WS price updates received
     # Tag discovery
-    "last_tag_discovery": 0.0,   # monotonic timestamp of last tag discovery run
+    last_tag_discovery: float = 0.0  # monotonic timestamp of last tag discovery run
     # Per-sport scan timing
-    "scan_metrics_by_sport": {},  # sport -> duration in seconds
+    scan_metrics_by_sport: dict = field(default_factory=dict)  # sport -> duration in seconds
+    rate_limit_stats: dict = field(default_factory=dict)       # platform -> {"granted", "throttled"}
+    # Active opportunities, mirrored from the DB: (team_a, yes, no) -> opp_id
+    active_opps: dict = field(default_factory=dict)
     # Matched events cache (avoids re-running matcher every scan)
-    "matched_events_cache": {},   # (poly_id, kalshi_id) -> SportEvent
-    "matched_events_cache_time": 0.0,  # When cache was built
+    matched_events_cache: dict = field(default_factory=dict)  # (poly_id, kalshi_id) -> SportEvent
+    matched_events_cache_time: float = 0.0  # When cache was built
+    matched_events_cache_inputs: tuple = (None, None)  # (poly_cache, kalshi_cache) it was built from
     # Executor components (set in main.py)
-    "executor_settings_manager": None,
-    "executor_ws_handler": None,
-    "trade_logger": None,
-    "poly_connector": None,
-    "kalshi_connector": None,
-}
+    executor: Any = None
+    executor_settings_manager: Any = None
+    executor_ws_handler: Any = None
+    trade_logger: Any = None
+    poly_connector: Any = None
+    kalshi_connector: Any = None
+
+
+app_state = AppState()
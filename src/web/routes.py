@@ -7,7 +7,7 @@ from datetime import UTC, date, datetime, timedelta
 from typing import AsyncGenerator
 
 from fastapi import APIRouter, Request, WebSocket
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from sse_starlette.sse import EventSourceResponse
 
 from src.db import db
@@ -31,17 +31,10 @@ def broadcast_event(event_type: str, data: dict) -> None:
             pass
 
 
-def _get_event_sport(event) -> str:
-    """Extract sport from a SportEvent's markets."""
-    pm = event.markets.get(Platform.POLYMARKET)
-    km = event.markets.get(Platform.KALSHI)
-    return (pm.sport if pm else "") or (km.sport if km else "") or ""
-
-
 def _compute_best_roi(event) -> float:
     """Compute the best ROI for sorting. Returns -999 for non-computable."""
-    pm = event.markets.get(Platform.POLYMARKET)
-    km = event.markets.get(Platform.KALSHI)
+    pm = event.poly_market
+    km = event.kalshi_market
     if not (event.matched and pm and pm.price and km and km.price):
         return -999.0
 
@@ -67,20 +60,20 @@ def _is_placeholder_price(price) -> bool:
             and price.yes_ask is None)
 
 
-def _is_stale_event(event) -> bool:
+def _is_stale_event(event, today: date | None = None) -> bool:
     """Check if a game event's date is in the past."""
-    pm = event.markets.get(Platform.POLYMARKET)
-    km = event.markets.get(Platform.KALSHI)
+    pm = event.poly_market
+    km = event.kalshi_market
     game_date = (pm.game_date if pm else None) or (km.game_date if km else None)
-    if game_date and game_date < date.today():
+    if game_date and game_date < (today or date.today()):
         return True
     return False
 
 
 def _is_futures_event(event) -> bool:
     """Check if event is a futures market."""
-    pm = event.markets.get(Platform.POLYMARKET)
-    km = event.markets.get(Platform.KALSHI)
+    pm = event.poly_market
+    km = event.kalshi_market
     pm_type = pm.market_type if pm else ""
     km_type = km.market_type if km else ""
     return pm_type == "futures" or km_type == "futures"
@@ -89,18 +82,19 @@ def _is_futures_event(event) -> bool:
 def _filter_and_sort_events(events: list, sport: str = "", min_roi: float | None = None, hide_futures: bool = False) -> list:
     """Filter events by sport/min_roi and sort: matched by ROI desc, then Kalshi-only."""
     if sport:
-        events = [e for e in events if _get_event_sport(e) == sport]
+        events = [e for e in events if e.sport == sport]
 
     if hide_futures:
         events = [e for e in events if not _is_futures_event(e)]
 
     # Remove stale events and placeholder-price junk
     cleaned = []
+    today = date.today()
     for e in events:
-        if _is_stale_event(e):
+        if _is_stale_event(e, today):
             continue
-        pm = e.markets.get(Platform.POLYMARKET)
-        km = e.markets.get(Platform.KALSHI)
+        pm = e.poly_market
+        km = e.kalshi_market
         # Skip events where Poly price is a 50/50 placeholder (no volume, no book)
         if pm and _is_placeholder_price(pm.price):
             continue
@@ -232,7 +226,7 @@ async def dashboard(request: Request):
     min_confidence = request.query_params.get("min_confidence", "all")
     opportunities = _filter_by_confidence(opportunities, min_confidence)
     from src.state import app_state
-    events = app_state.get("matched_events", [])
+    events = app_state.matched_events
     sport = request.query_params.get("sport", "")
     min_roi_param = request.query_params.get("min_roi", "-5")
     hide_futures = request.query_params.get("hide_futures", "") == "1"
@@ -243,10 +237,10 @@ async def dashboard(request: Request):
     events = _filter_and_sort_events(events, sport, min_roi=min_roi, hide_futures=hide_futures)
 
     # Collect available sports for filter buttons
-    all_events = app_state.get("matched_events", [])
+    all_events = app_state.matched_events
     sports_set: set[str] = set()
     for e in all_events:
-        s = _get_event_sport(e)
+        s = e.sport
         if s:
             sports_set.add(s)
     available_sports = sorted(sports_set)
@@ -267,9 +261,9 @@ async def dashboard(request: Request):
             "current_min_roi": min_roi_param,
             "available_sports": available_sports,
             "arb_teams": arb_teams,
-            "poly_count": app_state.get("poly_count", 0),
-            "kalshi_count": app_state.get("kalshi_count", 0),
-            "last_scan_duration": app_state.get("last_scan_duration", 0),
+            "poly_count": app_state.poly_count,
+            "kalshi_count": app_state.kalshi_count,
+            "last_scan_duration": app_state.last_scan_duration,
         },
     )
 
@@ -287,7 +281,7 @@ async def api_history():
 @router.get("/api/events")
 async def api_events():
     from src.state import app_state
-    events = app_state.get("matched_events", [])
+    events = app_state.matched_events
     return {
         "count": len(events),
         "events": [
@@ -303,10 +297,22 @@ async def api_events():
     }
 
 
+@router.get("/api/status")
+async def api_status():
+    from src.state import app_state
+    return {
+        "poly_count": app_state.poly_count,
+        "kalshi_count": app_state.kalshi_count,
+        "last_scan_duration": app_state.last_scan_duration,
+        "scan_metrics_by_sport": app_state.scan_metrics_by_sport,
+        "rate_limit_stats": app_state.rate_limit_stats,
+    }
+
+
 @router.get("/partials/events", response_class=HTMLResponse)
 async def partial_events(request: Request):
     from src.state import app_state
-    events = app_state.get("matched_events", [])
+    events = app_state.matched_events
     sport = request.query_params.get("sport", "")
     min_roi_param = request.query_params.get("min_roi", "-5")
     hide_futures = request.query_params.get("hide_futures", "") == "1"
@@ -326,7 +332,7 @@ async def partial_events(request: Request):
     return templates.TemplateResponse(
         "partials/events.html",
         {"request": request, "events": events, "arb_teams": arb_teams,
-         "scan_metrics_by_sport": app_state.get("scan_metrics_by_sport", {})},
+         "scan_metrics_by_sport": app_state.scan_metrics_by_sport},
     )
 
 
@@ -494,13 +500,37 @@ def set_executor_ws_handler(handler) -> None:
     _executor_ws_handler = handler
 
 
+_telegram_notifier = None
+
+
+def set_telegram_notifier(notifier) -> None:
+    """Set the Telegram notifier that receives webhook updates."""
+    global _telegram_notifier
+    _telegram_notifier = notifier
+
+
+@router.post("/api/telegram/webhook")
+async def telegram_webhook(request: Request):
+    """Telegram bot webhook (used when TELEGRAM_WEBHOOK_URL is set)."""
+    if _telegram_notifier is None or not _telegram_notifier.webhook_url:
+        # Polling mode (or no bot): the endpoint does not exist
+        return JSONResponse({"ok": False}, status_code=404)
+    accepted = await _telegram_notifier.process_webhook_update(
+        await request.json(),
+        secret=request.headers.get("X-Telegram-Bot-Api-Secret-Token"),
+    )
+    if not accepted:
+        return JSONResponse({"ok": False}, status_code=403)
+    return {"ok": True}
+
+
 @router.get("/executor", response_class=HTMLResponse)
 async def executor_page(request: Request):
     """Executor dashboard page."""
     from src.state import app_state
 
     # Get settings manager from app state
-    settings_manager = app_state.get("executor_settings_manager")
+    settings_manager = app_state.executor_settings_manager
     if settings_manager:
         settings = settings_manager.get()
     else:
@@ -510,8 +540,8 @@ async def executor_page(request: Request):
 
     # Get balances
     balances = {"poly": 0.0, "kalshi": 0.0}
-    poly_connector = app_state.get("poly_connector")
-    kalshi_connector = app_state.get("kalshi_connector")
+    poly_connector = app_state.poly_connector
+    kalshi_connector = app_state.kalshi_connector
     try:
         if poly_connector:
             balances["poly"] = await poly_connector.get_balance()
@@ -0,0 +1,14 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from src.db import Database
+
+
+@pytest.fixture
+async def database(tmp_path):
+    """Create database backed by a temp file."""
+    db = Database(str(tmp_path / "test.db"))
+    await db.connect()
+    yield db
+    await db.close()
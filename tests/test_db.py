@@ -0,0 +1,122 @@
+"""Tests for opportunity persistence."""
+
+import sqlite3
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.models import ArbitrageOpportunity, Platform
+
+
+def _opp(team_a: str, roi: float = 2.0) -> ArbitrageOpportunity:
+    return ArbitrageOpportunity(
+        event_title=f"{team_a} vs B",
+        team_a=team_a,
+        team_b="B",
+        platform_buy_yes=Platform.POLYMARKET,
+        platform_buy_no=Platform.KALSHI,
+        yes_price=0.48,
+        no_price=0.49,
+        total_cost=0.97,
+        profit_pct=3.0,
+        roi_after_fees=roi,
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_opportunities_inserts_and_dedups(database):
+    """Should insert new keys and update an existing active row in place."""
+    existing_id = await database.save_opportunity(_opp("Lakers", roi=1.0), sport="nba")
+
+    ids = await database.save_opportunities([
+        (_opp("Lakers", roi=3.5), "nba"),
+        (_opp("Celtics"), "nba"),
+    ])
+
+    assert ids[0] == existing_id
+    active = {o["team_a"]: o for o in await database.get_active_opportunities()}
+    assert set(active) == {"Lakers", "Celtics"}
+    assert active["Lakers"]["roi_after_fees"] == 3.5
+    assert active["Celtics"]["id"] == ids[1]
+
+
+@pytest.mark.asyncio
+async def test_save_opportunities_same_key_in_batch(database):
+    """A repeated key within one batch should update the row it just inserted."""
+    ids = await database.save_opportunities([
+        (_opp("Lakers", roi=2.0), "nba"),
+        (_opp("Lakers", roi=4.0), "nba"),
+    ])
+
+    assert ids[0] == ids[1]
+    active = await database.get_active_opportunities()
+    assert len(active) == 1
+    assert active[0]["roi_after_fees"] == 4.0
+
+
+@pytest.mark.asyncio
+async def test_save_opportunities_empty(database):
+    assert await database.save_opportunities([]) == []
+
+
+@pytest.mark.asyncio
+async def test_deactivate_by_keys(database):
+    """Should deactivate every active row matching one of the keys."""
+    await database.save_opportunities([
+        (_opp("Lakers"), "nba"),
+        (_opp("Celtics"), "nba"),
+        (_opp("Heat"), "nba"),
+    ])
+
+    n = await database.deactivate_by_keys([
+        ("Lakers", "polymarket", "kalshi"),
+        ("Celtics", "polymarket", "kalshi"),
+    ])
+
+    assert n == 2
+    active = await database.get_active_opportunities()
+    assert [o["team_a"] for o in active] == ["Heat"]
+
+
+@pytest.mark.asyncio
+async def test_save_opportunities_with_active_index(database):
+    """A caller-supplied active index is used for dedup and updated in place."""
+    active = {("Lakers", "polymarket", "kalshi"): "known-id"}
+
+    ids = await database.save_opportunities(
+        [(_opp("Lakers"), "nba"), (_opp("Celtics"), "nba")], active=active,
+    )
+
+    assert ids[0] == "known-id"
+    assert active[("Celtics", "polymarket", "kalshi")] == ids[1]
+
+
+@pytest.mark.asyncio
+async def test_save_opportunities_failed_write_leaves_index_unchanged(database, monkeypatch):
+    """A write that raises must not leave ids for rows that were never stored."""
+    active = {("Lakers", "polymarket", "kalshi"): "known-id"}
+    monkeypatch.setattr(
+        database._db, "executemany",
+        AsyncMock(side_effect=sqlite3.OperationalError("database is locked")),
+    )
+
+    with pytest.raises(sqlite3.OperationalError):
+        await database.save_opportunities(
+            [(_opp("Lakers"), "nba"), (_opp("Celtics"), "nba")], active=active,
+        )
+
+    assert active == {("Lakers", "polymarket", "kalshi"): "known-id"}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_active_roi(database):
+    """Should snapshot every active opportunity's current ROI."""
+    ids = await database.save_opportunities([
+        (_opp("Lakers", roi=2.5), "nba"),
+        (_opp("Celtics", roi=1.5), "nba"),
+    ])
+    await database.deactivate_by_keys([("Celtics", "polymarket", "kalshi")])
+
+    assert await database.snapshot_active_roi() == 1
+    history = await database.get_roi_history(ids[0])
+    assert [h["roi"] for h in history] == [2.5]
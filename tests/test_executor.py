@@ -93,7 +93,7 @@ async def test_executor_executes_valid_opportunity(mock_components, sample_oppor
 
     # LegResult(platform, success, order_id, filled_shares, filled_price, filled_cost)
     poly_leg = LegResult("polymarket", True, "p1", 2.0, 0.51, 1.02)
-    kalshi_leg = LegResult("kalshi", True, "k1", 2.0, 0.49, 0.98)
+    kalshi_leg = LegResult("kalshi", True, "k1", 2.0, 0.49, 0.98, filled_contracts=2)
     mock_components["order_placer"].execute.return_value = ExecutionResult(
         poly_leg=poly_leg, kalshi_leg=kalshi_leg
     )
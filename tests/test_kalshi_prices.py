@@ -0,0 +1,99 @@
+"""Tests for Kalshi price fetching."""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.connectors import kalshi as kalshi_module
+from src.connectors.kalshi import KalshiConnector
+from src.models import MarketPrice
+
+
+def _markets_response(tickers: list[str]) -> MagicMock:
+    resp = MagicMock()
+    resp.content = json.dumps({
+        "markets": [
+            {"ticker": t, "yes_bid": 40, "yes_ask": 44, "no_bid": 56, "no_ask": 60, "volume": 10}
+            for t in tickers
+        ]
+    }).encode()
+    return resp
+
+
+@pytest.mark.asyncio
+async def test_fetch_prices_batch_chunks_tickers(monkeypatch):
+    """Should request tickers in chunks and parse every returned market."""
+    monkeypatch.setattr(kalshi_module, "_BATCH_TICKERS", 2)
+    kalshi = KalshiConnector()
+    kalshi._request_with_retry = AsyncMock(
+        side_effect=lambda method, path, params: _markets_response(params["tickers"].split(","))
+    )
+
+    prices = await kalshi.fetch_prices_batch(["A", "B", "C"])
+
+    assert kalshi._request_with_retry.await_count == 2
+    assert set(prices) == {"A", "B", "C"}
+    assert prices["A"].yes_bid == 0.40
+    assert prices["A"].yes_price == 0.42
+
+
+@pytest.mark.asyncio
+async def test_poll_active_markets_falls_back_for_missing():
+    """Tickers missing from the batch response should be fetched individually."""
+    kalshi = KalshiConnector()
+    kalshi._request_with_retry = AsyncMock(return_value=_markets_response(["A"]))
+    kalshi.fetch_price = AsyncMock(return_value=MarketPrice(yes_price=0.3, no_price=0.7))
+
+    prices = await kalshi.poll_active_markets(["A", "B"])
+
+    kalshi.fetch_price.assert_awaited_once_with("B")
+    assert set(prices) == {"A", "B"}
+
+
+@pytest.mark.asyncio
+async def test_fetch_prices_batch_dedups_tickers():
+    """A ticker listed twice should be requested once."""
+    kalshi = KalshiConnector()
+    kalshi._request_with_retry = AsyncMock(return_value=_markets_response(["A", "B"]))
+
+    prices = await kalshi.fetch_prices_batch(["A", "B", "A"])
+
+    params = kalshi._request_with_retry.await_args.kwargs["params"]
+    assert params["tickers"] == "A,B"
+    assert set(prices) == {"A", "B"}
+
+
+@pytest.mark.asyncio
+async def test_poll_active_markets_reports_prices_as_they_arrive():
+    """on_price should see batch and fallback prices as each one lands."""
+    kalshi = KalshiConnector()
+    kalshi._request_with_retry = AsyncMock(return_value=_markets_response(["A"]))
+    kalshi.fetch_price = AsyncMock(return_value=MarketPrice(yes_price=0.3, no_price=0.7))
+    seen: list[str] = []
+
+    await kalshi.poll_active_markets(["A", "B"], on_price=lambda t, p: seen.append(t))
+
+    assert seen == ["A", "B"]
+
+
+@pytest.mark.asyncio
+async def test_request_with_retry_honors_retry_after(monkeypatch):
+    """A 429 with Retry-After should wait that long before retrying."""
+    kalshi = KalshiConnector()
+    kalshi._http = MagicMock()
+    kalshi._http.build_request.return_value.url.raw_path = b"/markets"
+    throttled = MagicMock(status_code=429, headers={"Retry-After": "0.5"})
+    ok = MagicMock(status_code=200)
+    kalshi._http.request = AsyncMock(side_effect=[throttled, ok])
+    sleeps: list[float] = []
+
+    async def _sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(kalshi_module.asyncio, "sleep", _sleep)
+
+    resp = await kalshi._request_with_retry("GET", "/markets")
+
+    assert resp is ok
+    assert sleeps == [0.5]
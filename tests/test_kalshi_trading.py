@@ -1,7 +1,7 @@
 """Tests for Kalshi trading methods."""
 
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from src.connectors.kalshi import KalshiConnector
 
@@ -11,7 +11,7 @@ def kalshi():
     """Create Kalshi connector with mocked credentials."""
     connector = KalshiConnector()
     connector._member_id = "test_member"
-    connector._http = MagicMock()  # Pretend we're connected
+    connector._trade_http = MagicMock()  # Pretend we're connected
     return connector
 
 
@@ -22,11 +22,8 @@ async def test_get_balance(kalshi):
     mock_response.json.return_value = {"balance": 1050}  # cents
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-            return_value=mock_response
-        )
-        balance = await kalshi.get_balance()
+    kalshi._trade_http.get = AsyncMock(return_value=mock_response)
+    balance = await kalshi.get_balance()
 
     assert balance == 10.50  # converted to dollars
 
@@ -46,17 +43,14 @@ async def test_place_order_buy_yes(kalshi):
         }
     }
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
-        )
-        result = await kalshi.place_order(
-            ticker="KXNBA-123",
-            side="yes",
-            action="buy",
-            count=2,
-            price_cents=51,
-        )
+    kalshi._trade_http.post = AsyncMock(return_value=mock_response)
+    result = await kalshi.place_order(
+        ticker="KXNBA-123",
+        side="yes",
+        action="buy",
+        count=2,
+        price_cents=51,
+    )
 
     assert result["order_id"] == "ord_123"
     assert result["status"] == "resting"
@@ -77,17 +71,14 @@ async def test_place_order_buy_no(kalshi):
         }
     }
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
-        )
-        result = await kalshi.place_order(
-            ticker="KXNBA-123",
-            side="no",
-            action="buy",
-            count=2,
-            price_cents=48,
-        )
+    kalshi._trade_http.post = AsyncMock(return_value=mock_response)
+    result = await kalshi.place_order(
+        ticker="KXNBA-123",
+        side="no",
+        action="buy",
+        count=2,
+        price_cents=48,
+    )
 
     assert result["order_id"] == "ord_456"
     assert result["status"] == "filled"
@@ -101,17 +92,26 @@ async def test_place_order_error(kalshi):
     mock_response.content = b'{"message": "Insufficient balance"}'
     mock_response.json.return_value = {"message": "Insufficient balance"}
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.post = AsyncMock(
-            return_value=mock_response
-        )
-        result = await kalshi.place_order(
-            ticker="KXNBA-123",
-            side="yes",
-            action="buy",
-            count=2,
-            price_cents=51,
-        )
+    kalshi._trade_http.post = AsyncMock(return_value=mock_response)
+    result = await kalshi.place_order(
+        ticker="KXNBA-123",
+        side="yes",
+        action="buy",
+        count=2,
+        price_cents=51,
+    )
 
     assert result["status"] == "failed"
     assert "Insufficient balance" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_trading_uses_its_own_client():
+    """Orders must not share the market data connection pool."""
+    connector = KalshiConnector()
+    await connector.connect()
+    try:
+        assert connector._trade_http is not None
+        assert connector._trade_http is not connector._http
+    finally:
+        await connector.disconnect()
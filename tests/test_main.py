@@ -0,0 +1,227 @@
+"""Tests for the scan loop helpers in src.main."""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src import main
+from src.models import Market, MarketPrice, Platform, SportEvent
+from src.state import AppState
+
+
+@pytest.fixture
+def state(monkeypatch):
+    """Fresh app state and no background market refresh."""
+    fresh = AppState()
+    monkeypatch.setattr(main, "app_state", fresh)
+    monkeypatch.setattr(main, "_market_prefetch", None)
+    monkeypatch.setattr(main, "_token_to_event", {})
+    monkeypatch.setattr(main, "_ws_subs_changed", asyncio.Event())
+    yield fresh
+    if main._market_prefetch is not None:
+        main._market_prefetch.cancel()
+
+
+def _poly_event(token_id: str) -> SportEvent:
+    market = Market(
+        platform=Platform.POLYMARKET, market_id=f"m-{token_id}", event_id="e",
+        title="A vs B", team_a="A", team_b="B", raw_data={"clob_token_ids": [token_id]},
+    )
+    return SportEvent(title="A vs B", team_a="A", team_b="B", markets={Platform.POLYMARKET: market})
+
+
+def _price(yes: float) -> MarketPrice:
+    return MarketPrice(yes_price=yes, no_price=1 - yes)
+
+
+def _connector(*results) -> MagicMock:
+    conn = MagicMock()
+    conn.fetch_sports_events = AsyncMock(side_effect=list(results))
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_stale_lists_served_while_prefetch_runs(state):
+    """An expired list is used as-is while a single background refresh runs."""
+    old_poly, new_poly, kalshi_markets = [MagicMock()], [MagicMock()], [MagicMock()]
+    release = asyncio.Event()
+
+    async def slow_fetch():
+        await release.wait()
+        return new_poly
+
+    poly = MagicMock()
+    poly.fetch_sports_events = AsyncMock(side_effect=slow_fetch)
+    kalshi = _connector()
+    now = time.monotonic()
+    state.poly_cache, state.poly_cache_time = old_poly, now - 150
+    state.kalshi_cache, state.kalshi_cache_time = kalshi_markets, now
+
+    main._schedule_market_prefetch(poly, kalshi, 10, poly_ttl=100, kalshi_ttl=100)
+    prefetch = main._market_prefetch
+    main._schedule_market_prefetch(poly, kalshi, 10, poly_ttl=100, kalshi_ttl=100)
+    assert main._market_prefetch is prefetch
+
+    await asyncio.sleep(0)
+    assert await main._load_market_lists(poly, kalshi, 100, 100) == (False, False)
+    assert state.poly_cache is old_poly
+    poly.fetch_sports_events.assert_called_once()
+    kalshi.fetch_sports_events.assert_not_called()
+
+    release.set()
+    await prefetch
+    assert await main._load_market_lists(poly, kalshi, 100, 100) == (True, False)
+    assert state.poly_cache is new_poly
+    assert main._market_prefetch is None
+
+
+@pytest.mark.asyncio
+async def test_failed_prefetch_falls_back_to_inline_fetch(state):
+    """A refresh that raised is logged and the hard-stale list is fetched inline."""
+    fresh = [MagicMock()]
+    poly = _connector(RuntimeError("gamma down"), fresh)
+    kalshi = _connector()
+    now = time.monotonic()
+    state.poly_cache, state.poly_cache_time = [MagicMock()], now - 500
+    state.kalshi_cache, state.kalshi_cache_time = [MagicMock()], now
+
+    main._schedule_market_prefetch(poly, kalshi, 10, poly_ttl=100, kalshi_ttl=100)
+
+    assert await main._load_market_lists(poly, kalshi, 100, 100) == (True, False)
+    assert state.poly_cache is fresh
+    assert poly.fetch_sports_events.await_count == 2
+    assert main._market_prefetch is None
+
+
+@pytest.mark.asyncio
+async def test_prefetch_uses_current_scan_interval(state):
+    """A backed-off interval should trigger the refresh the normal one would not."""
+    poly = _connector([MagicMock()])
+    kalshi = _connector()
+    now = time.monotonic()
+    state.poly_cache_time = state.kalshi_cache_time = now - 50
+
+    main._schedule_market_prefetch(poly, kalshi, 30, poly_ttl=100, kalshi_ttl=1000)
+    assert main._market_prefetch is None
+
+    main._schedule_market_prefetch(poly, kalshi, 60, poly_ttl=100, kalshi_ttl=1000)
+    assert await main._market_prefetch == (True, False)
+
+
+def test_adaptive_ttl_scales_with_day_and_churn():
+    """Game days halve the TTL, a stable set doubles it, churn shortens it."""
+    assert main._adaptive_ttl(300, 0.0, game_day=False) == 600
+    assert main._adaptive_ttl(300, 0.0, game_day=True) == 150
+    assert main._adaptive_ttl(300, 0.5, game_day=False) == 200
+
+
+def test_adaptive_ttl_clamped():
+    assert main._adaptive_ttl(10, 0.5, game_day=True) == main.MIN_CACHE_TTL
+    assert main._adaptive_ttl(5000, 0.0, game_day=False) == main.MAX_CACHE_TTL
+
+
+def test_record_match_churn_updates_ema(state):
+    """The churn EMA moves toward the changed share of matched pairs."""
+    main._record_match_churn({"a", "b"}, {"a", "c"})  # 2 of 3 pairs changed
+
+    assert state.match_churn_ema == pytest.approx(main.CHURN_EMA_ALPHA * 2 / 3)
+
+
+def test_record_match_churn_ignores_first_build_and_no_change(state):
+    state.match_churn_ema = 0.5
+    main._record_match_churn(set(), {"a", "b"})
+    assert state.match_churn_ema == 0.5
+
+    main._record_match_churn({"a", "b"}, {"a", "b"})
+    assert state.match_churn_ema == pytest.approx(0.5 * (1 - main.CHURN_EMA_ALPHA))
+
+
+@pytest.mark.asyncio
+async def test_ws_burst_coalesced_into_one_flush(state, monkeypatch):
+    """A burst of ticks is applied once per token, with the latest price."""
+    monkeypatch.setattr(main, "WS_FLUSH_INTERVAL", 0.01)
+    apply = MagicMock(side_effect=main._apply_ws_price)
+    monkeypatch.setattr(main, "_apply_ws_price", apply)
+    events = {tid: _poly_event(tid) for tid in ("t1", "t2")}
+    main._token_to_event.update(events)
+    state.ws_subscribed_ids = set(events)
+    ticks = [("t1", _price(0.40)), ("t2", _price(0.55)), ("t1", _price(0.42)), ("t1", _price(0.45))]
+
+    async def subscribe_prices(tokens, shard):
+        for tick in ticks:
+            yield tick
+
+    poly = MagicMock(subscribe_prices=subscribe_prices)
+    pending: dict[str, MarketPrice] = {}
+    await main._ws_shard_listener(poly, 0, 1, pending)
+    assert pending == {"t1": ticks[3][1], "t2": ticks[1][1]}
+    assert state.ws_update_count == 4
+
+    flush = asyncio.create_task(main._flush_ws_prices(pending))
+    try:
+        async with asyncio.timeout(1):
+            while pending or apply.call_count < 2:
+                await asyncio.sleep(0.01)
+    finally:
+        flush.cancel()
+
+    assert apply.call_count == 2
+    assert events["t1"].poly_market.price.yes_price == 0.45
+    assert events["t2"].poly_market.price.yes_price == 0.55
+    assert events["t1"].poly_market.price_ts is not None
+
+
+@pytest.mark.asyncio
+async def test_resubscribe_routes_tokens_to_their_shards(state):
+    """Subscription changes are split by shard and dropped tokens unsubscribed."""
+    shards = 3
+    poly = MagicMock(update_subscriptions=AsyncMock())
+    sync = asyncio.create_task(main._sync_ws_subscriptions(poly, shards))
+
+    async def pushed() -> dict[int, set[str]]:
+        async with asyncio.timeout(1):
+            while poly.update_subscriptions.await_count < shards:
+                await asyncio.sleep(0)
+        sent = {c.kwargs["shard"]: c.args[0] for c in poly.update_subscriptions.await_args_list}
+        poly.update_subscriptions.reset_mock()
+        return sent
+
+    try:
+        main._update_ws_subscriptions([_poly_event(t) for t in ("t1", "t2", "t3")])
+        first = await pushed()
+        main._update_ws_subscriptions([_poly_event(t) for t in ("t2", "t3", "t4")])
+        second = await pushed()
+    finally:
+        sync.cancel()
+
+    for sent, tokens in ((first, {"t1", "t2", "t3"}), (second, {"t2", "t3", "t4"})):
+        assert set().union(*sent.values()) == tokens
+        for shard, shard_tokens in sent.items():
+            assert all(hash(t) % shards == shard for t in shard_tokens)
+
+
+
+def test_update_ws_subscriptions_seeds_and_prunes_cache(state):
+    """New events start from a cached WS price; dropped tokens leave the cache."""
+    cached = _price(0.61)
+    state.ws_price_cache = {"t1": cached, "gone": _price(0.3)}
+    state.ws_subscribed_ids = {"t1", "gone"}
+    event = _poly_event("t1")
+
+    main._update_ws_subscriptions([event, _poly_event("t2")])
+
+    assert event.poly_market.price.yes_price == 0.61
+    assert set(state.ws_price_cache) == {"t1"}
+    assert state.ws_subscribed_ids == {"t1", "t2"}
+    assert main._token_to_event["t1"] is event
+    assert main._ws_subs_changed.is_set()
+
+
+def test_update_ws_subscriptions_unchanged_set_not_pushed(state):
+    state.ws_subscribed_ids = {"t1"}
+
+    main._update_ws_subscriptions([_poly_event("t1")])
+
+    assert not main._ws_subs_changed.is_set()
@@ -0,0 +1,35 @@
+"""Tests for Polymarket WS subscription updates."""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.connectors.polymarket import PolymarketConnector
+
+
+@pytest.mark.asyncio
+async def test_update_subscriptions_sends_diff():
+    """Only added/removed tokens should be sent on the shard's open socket."""
+    poly = PolymarketConnector()
+    ws = AsyncMock()
+    poly._ws = {1: ws}
+    poly._ws_asset_ids = {1: {"a", "b"}}
+
+    await poly.update_subscriptions({"b", "c"}, shard=1)
+
+    sent = [json.loads(call.args[0]) for call in ws.send.await_args_list]
+    assert sent[0]["operation"] == "subscribe"
+    assert sent[0]["assets_ids"] == ["c"]
+    assert sent[1] == {"assets_ids": ["a"], "operation": "unsubscribe"}
+    assert poly._ws_asset_ids[1] == {"b", "c"}
+
+
+@pytest.mark.asyncio
+async def test_update_subscriptions_without_socket():
+    """With no open socket the set is updated for the next connect."""
+    poly = PolymarketConnector()
+
+    await poly.update_subscriptions({"x"})
+
+    assert poly._ws_asset_ids[0] == {"x"}
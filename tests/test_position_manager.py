@@ -82,6 +82,20 @@ async def test_get_open_positions(position_manager, sample_position):
     assert positions[0].id == "pos_123"
 
 
+@pytest.mark.asyncio
+async def test_open_positions_cached_until_write(position_manager, sample_position):
+    """Should serve open positions from memory and refresh after a write."""
+    await position_manager.save_position(sample_position)
+    first = await position_manager.get_open_positions()
+
+    # Out-of-band change is not seen until the manager writes again
+    await position_manager._db.execute("DELETE FROM positions")
+    assert [p.id for p in await position_manager.get_open_positions()] == [p.id for p in first]
+
+    await position_manager.settle_position("pos_123", 0.05, "poly")
+    assert await position_manager.get_open_positions() == []
+
+
 @pytest.mark.asyncio
 async def test_settle_position(position_manager, sample_position):
     """Should mark position as settled with P&L."""
@@ -0,0 +1,75 @@
+"""Tests for the async rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.connectors.rate_limit import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_window_delays_excess_requests():
+    """Requests beyond max_requests per period should wait for the window."""
+    limiter = RateLimiter(max_concurrent=10, max_requests=2, period=0.2)
+    started: list[float] = []
+
+    async def _call():
+        async with limiter:
+            started.append(time.monotonic())
+
+    t0 = time.monotonic()
+    await asyncio.gather(*(_call() for _ in range(3)))
+
+    assert started[2] - t0 >= 0.18
+    assert limiter.stats() == {"granted": 3, "throttled": 1}
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap():
+    """No more than max_concurrent holders at once."""
+    limiter = RateLimiter(max_concurrent=2, max_requests=100)
+    active = peak = 0
+
+    async def _call():
+        nonlocal active, peak
+        async with limiter:
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(_call() for _ in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_only_limiter_does_not_cap_concurrency():
+    """With max_concurrent=None a slow holder should not block others."""
+    limiter = RateLimiter(max_concurrent=None, max_requests=100)
+    release = asyncio.Event()
+
+    async def _slow():
+        async with limiter:
+            await release.wait()
+
+    slow = asyncio.create_task(_slow())
+    await asyncio.sleep(0)
+    async with limiter:
+        pass  # entered while the slow request is still in flight
+    release.set()
+    await slow
+
+
+
+@pytest.mark.asyncio
+async def test_status_route_reports_limiter_stats(monkeypatch):
+    """The per-scan limiter counters should be readable from /api/status."""
+    from src.state import app_state
+    from src.web import routes
+
+    stats = {"kalshi": {"granted": 40, "throttled": 3}}
+    monkeypatch.setattr(app_state, "rate_limit_stats", stats)
+
+    assert (await routes.api_status())["rate_limit_stats"] == stats
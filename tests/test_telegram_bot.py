@@ -1,10 +1,12 @@
 """Tests for Telegram notifier."""
 
 import pytest
+from telegram import Update
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, UTC
 
 from src.executor.telegram_bot import TelegramNotifier
+from src.web import routes
 from src.executor.models import ExecutionResult, ExecutionStatus, LegResult, OpenPosition
 
 
@@ -17,7 +19,7 @@ def notifier():
 def test_format_execution_success(notifier):
     """Should format successful execution message."""
     poly = LegResult("polymarket", True, "p1", 2.0, 0.51, 1.02)
-    kalshi = LegResult("kalshi", True, "k1", 2.0, 0.49, 0.98)
+    kalshi = LegResult("kalshi", True, "k1", 2.0, 0.49, 0.98, filled_contracts=2)
     result = ExecutionResult(
         poly_leg=poly,
         kalshi_leg=kalshi,
@@ -36,6 +38,7 @@ def test_format_execution_success(notifier):
     assert "✅" in msg
     assert "Lakers vs Celtics" in msg
     assert "2.3%" in msg or "ROI" in msg
+    assert "2 contracts" in msg
 
 
 def test_format_execution_partial(notifier):
@@ -122,3 +125,136 @@ async def test_send_message(notifier):
         await notifier.send("Test message")
 
         mock_bot.send_message.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_webhook_update_rejects_bad_secret():
+    """Webhook updates with the wrong secret should not reach the bot."""
+    notifier = TelegramNotifier(
+        bot_token="test_token", chat_id="123456",
+        webhook_url="https://example.com/api/telegram/webhook", webhook_secret="s3cret",
+    )
+    notifier._app = MagicMock()
+    notifier._app.update_queue = AsyncMock()
+
+    assert await notifier.process_webhook_update({"update_id": 1}, secret="wrong") is False
+    notifier._app.update_queue.put.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_webhook_update_ignored_when_commands_not_running(notifier):
+    """Without setup_commands there is no application to dispatch to."""
+    assert await notifier.process_webhook_update({"update_id": 1}) is False
+
+
+@pytest.mark.asyncio
+async def test_webhook_update_rejected_in_polling_mode(notifier):
+    """Without a webhook URL and secret, POSTed updates must never be dispatched."""
+    notifier._app = MagicMock()
+    notifier._app.update_queue = AsyncMock()
+
+    assert await notifier.process_webhook_update({"update_id": 1}) is False
+    assert await notifier.process_webhook_update({"update_id": 1}, secret="") is False
+    notifier._app.update_queue.put.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_webhook_route_404_in_polling_mode(notifier):
+    """The webhook endpoint should not exist while the bot is polling."""
+    notifier._app = MagicMock()
+    notifier._app.update_queue = AsyncMock()
+    request = MagicMock()
+    request.json = AsyncMock(return_value={"update_id": 1, "message": {"text": "/start"}})
+    request.headers = {}
+    routes.set_telegram_notifier(notifier)
+    try:
+        resp = await routes.telegram_webhook(request)
+    finally:
+        routes.set_telegram_notifier(None)
+
+    assert resp.status_code == 404
+    notifier._app.update_queue.put.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_webhook_url_without_secret_falls_back_to_polling():
+    """A webhook URL with no secret should not register the webhook."""
+    notifier = TelegramNotifier(
+        bot_token="test_token", chat_id="123456",
+        webhook_url="https://example.com/api/telegram/webhook",
+    )
+    with patch("src.executor.telegram_bot.Application") as MockApp:
+        app = MockApp.builder.return_value.token.return_value.build.return_value
+        app.initialize = AsyncMock()
+        app.start = AsyncMock()
+        app.bot.set_webhook = AsyncMock()
+        app.updater.start_polling = AsyncMock()
+
+        await notifier.setup_commands(executor=MagicMock())
+
+    app.bot.set_webhook.assert_not_awaited()
+    app.updater.start_polling.assert_awaited_once()
+    assert await notifier.process_webhook_update({"update_id": 1}, secret="") is False
+
+
+@pytest.mark.asyncio
+async def test_commands_only_accepted_from_configured_chat(notifier):
+    """Command handlers should ignore messages from any other chat."""
+    with patch("src.executor.telegram_bot.Application") as MockApp:
+        app = MockApp.builder.return_value.token.return_value.build.return_value
+        app.initialize = AsyncMock()
+        app.start = AsyncMock()
+        app.updater.start_polling = AsyncMock()
+
+        await notifier.setup_commands(executor=MagicMock())
+
+    handlers = [call.args[0] for call in app.add_handler.call_args_list]
+
+    def _start_from(chat_id: int) -> Update:
+        return Update.de_json({
+            "update_id": 1,
+            "message": {
+                "message_id": 1, "date": 0, "text": "/start",
+                "chat": {"id": chat_id, "type": "private"},
+                "entities": [{"type": "bot_command", "offset": 0, "length": 6}],
+            },
+        }, MagicMock(username="arb_bot"))
+
+    start = next(h for h in handlers if "start" in h.commands)
+    assert start.check_update(_start_from(123456))
+    assert not start.check_update(_start_from(999))
+
+
+@pytest.mark.asyncio
+async def test_channel_username_chat_id_accepted():
+    """An @channel chat_id should filter by username instead of failing startup."""
+    notifier = TelegramNotifier(bot_token="test_token", chat_id="@arb_alerts")
+    with patch("src.executor.telegram_bot.Application") as MockApp:
+        app = MockApp.builder.return_value.token.return_value.build.return_value
+        app.initialize = AsyncMock()
+        app.start = AsyncMock()
+        app.updater.start_polling = AsyncMock()
+
+        await notifier.setup_commands(executor=MagicMock())
+
+    handler = app.add_handler.call_args_list[0].args[0]
+    assert handler.filters.usernames == frozenset({"arb_alerts"})
+
+
+@pytest.mark.asyncio
+async def test_stop_deletes_webhook():
+    """Stopping in webhook mode should unregister the webhook with Telegram."""
+    notifier = TelegramNotifier(
+        bot_token="test_token", chat_id="123456",
+        webhook_url="https://example.com/api/telegram/webhook", webhook_secret="s3cret",
+    )
+    notifier._app = MagicMock()
+    notifier._app.bot.delete_webhook = AsyncMock()
+    notifier._app.updater.running = False
+    notifier._app.stop = AsyncMock()
+    notifier._app.shutdown = AsyncMock()
+
+    await notifier.stop_commands()
+
+    notifier._app.bot.delete_webhook.assert_awaited_once()
+    notifier._app.shutdown.assert_awaited_once()
@@ -0,0 +1,54 @@
+"""Tests for trade logger."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.executor import trade_logger as trade_logger_module
+from src.executor.trade_logger import TradeLogger
+
+
+@pytest.mark.asyncio
+async def test_log_trade_writes_in_background(database):
+    """Queued trades should be saved and broadcast in order after flush."""
+    ws = AsyncMock()
+    trade_logger = TradeLogger(db=database, ws_handler=ws)
+
+    await trade_logger.log_trade("Lakers vs Celtics", "SUCCESS", 10.0, pnl=0.4, roi=4.0)
+    await trade_logger.log_trade("Nets vs Knicks", "FAILED", 5.0, details={"error": "timeout"})
+    await trade_logger.flush()
+
+    trades = await database.get_executor_trades()
+    assert {t["event_title"] for t in trades} == {"Lakers vs Celtics", "Nets vs Knicks"}
+    sent = [c.kwargs["event_title"] for c in ws.broadcast_trade_event.await_args_list]
+    assert sent == ["Lakers vs Celtics", "Nets vs Knicks"]
+
+
+@pytest.mark.asyncio
+async def test_log_trade_retries_failed_batch(monkeypatch):
+    """A failed batch write should be retried, not dropped."""
+    monkeypatch.setattr(trade_logger_module, "_RETRY_DELAY", 0)
+    db = AsyncMock()
+    db.save_executor_trades.side_effect = [RuntimeError("locked"), None, None]
+    trade_logger = TradeLogger(db=db)
+
+    await trade_logger.log_trade("A vs B", "SUCCESS", 5.0)
+    assert await trade_logger.flush() is True
+    await trade_logger.log_trade("C vs D", "SUCCESS", 5.0)
+    await trade_logger.flush()
+
+    saved = [c.args[0][0]["event_title"] for c in db.save_executor_trades.await_args_list]
+    assert saved == ["A vs B", "A vs B", "C vs D"]
+
+
+@pytest.mark.asyncio
+async def test_flush_reports_unsaved_trades(monkeypatch):
+    """flush() should time out and report failure while the DB keeps failing."""
+    monkeypatch.setattr(trade_logger_module, "_RETRY_DELAY", 0.01)
+    db = AsyncMock()
+    db.save_executor_trades.side_effect = RuntimeError("disk full")
+    trade_logger = TradeLogger(db=db)
+
+    await trade_logger.log_trade("A vs B", "SUCCESS", 5.0)
+
+    assert await trade_logger.flush(timeout=0.1) is False
+    trade_logger._writer.cancel()
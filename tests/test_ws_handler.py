@@ -0,0 +1,140 @@
+"""Tests for executor WebSocket handler."""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.executor.ws_handler import ExecutorWSHandler
+
+
+@pytest.fixture
+def handler():
+    """Create handler with mocked dependencies."""
+    return ExecutorWSHandler(settings_manager=MagicMock(), db=AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_broadcast_sends_same_payload_to_all(handler):
+    """Should serialize once and send to every client."""
+    ws1, ws2 = AsyncMock(), AsyncMock()
+    handler._connections = frozenset({ws1, ws2})
+
+    await handler.broadcast({"type": "status_changed", "data": {"enabled": True}})
+
+    for ws in (ws1, ws2):
+        ws.send_text.assert_awaited_once()
+        sent = json.loads(ws.send_text.await_args.args[0])
+        assert sent == {"type": "status_changed", "data": {"enabled": True}}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_drops_failed_clients(handler):
+    """Should remove clients whose send raised."""
+    good, bad = AsyncMock(), AsyncMock()
+    bad.send_text.side_effect = RuntimeError("closed")
+    handler._connections = frozenset({good, bad})
+
+    await handler.broadcast({"type": "ping"})
+
+    assert handler._connections == {good}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_slow_client_does_not_block_others(handler):
+    """Sends should run concurrently, not one after another."""
+    release = asyncio.Event()
+    fast_done = asyncio.Event()
+
+    async def slow_send(_):
+        await release.wait()
+
+    async def fast_send(_):
+        fast_done.set()
+
+    slow, fast = AsyncMock(), AsyncMock()
+    slow.send_text.side_effect = slow_send
+    fast.send_text.side_effect = fast_send
+    handler._connections = frozenset({slow, fast})
+
+    task = asyncio.create_task(handler.broadcast({"type": "ping"}))
+    await asyncio.wait_for(fast_done.wait(), timeout=1)
+    release.set()
+    await task
+
+
+def test_dumps_falls_back_to_stdlib(monkeypatch):
+    """Should produce the same compact JSON without orjson installed."""
+    from src.executor import ws_handler
+
+    message = {"type": "trade_event", "data": {"event": "Atlético vs Celtics", "pnl": 1.5}}
+    fast = ws_handler._dumps(message)
+    monkeypatch.setattr(ws_handler, "orjson", None)
+    assert json.loads(ws_handler._dumps(message)) == json.loads(fast) == message
+
+
+@pytest.mark.asyncio
+async def test_init_state_shared_across_concurrent_connections(handler):
+    """Concurrent connects within the TTL should hit the DB only once."""
+    handler.settings.get.return_value = MagicMock(enabled=False, to_dict=lambda: {})
+    handler.db.get_daily_executor_stats.return_value = {}
+    handler.db.get_executor_positions.return_value = []
+    handler.db.get_executor_trades.return_value = []
+
+    payloads = await asyncio.gather(*(handler._get_init_payload() for _ in range(5)))
+
+    assert all(p is payloads[0] for p in payloads)
+    assert json.loads(payloads[0])["type"] == "init"
+    handler.db.get_daily_executor_stats.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_invalidates_init_cache(handler):
+    """A state-change broadcast should force the next init to rebuild."""
+    handler.settings.get.return_value = MagicMock(enabled=False, to_dict=lambda: {})
+    handler.db.get_daily_executor_stats.return_value = {}
+    handler.db.get_executor_positions.return_value = []
+    handler.db.get_executor_trades.return_value = []
+
+    await handler._get_init_payload()
+    await handler.broadcast({"type": "status_changed", "data": {"enabled": True}})
+    await handler._get_init_payload()
+
+    assert handler.db.get_daily_executor_stats.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_init_rebuild_racing_broadcast_is_not_cached(handler):
+    """A payload built across a broadcast must not be cached as fresh."""
+    handler.settings.get.return_value = MagicMock(enabled=False, to_dict=lambda: {})
+    handler.db.get_executor_positions.return_value = []
+    handler.db.get_executor_trades.return_value = []
+
+    async def stats_then_broadcast():
+        await handler.broadcast({"type": "status_changed", "data": {"enabled": True}})
+        return {}
+
+    handler.db.get_daily_executor_stats.side_effect = stats_then_broadcast
+
+    payload = await handler._get_init_payload()
+
+    assert json.loads(payload)["type"] == "init"
+    assert handler._init_cache is None
+
+
+@pytest.mark.asyncio
+async def test_init_state_balance_failure_is_isolated():
+    """One failing balance call should not zero the other platform."""
+    poly, kalshi = AsyncMock(), AsyncMock()
+    poly.get_balance.return_value = 12.5
+    kalshi.get_balance.side_effect = RuntimeError("auth")
+    handler = ExecutorWSHandler(
+        settings_manager=MagicMock(), db=AsyncMock(),
+        poly_connector=poly, kalshi_connector=kalshi,
+    )
+    handler.db.get_daily_executor_stats.return_value = {}
+
+    state = await handler._build_init_state()
+
+    assert state["balances"] == {"poly": 12.5, "kalshi": 0.0}